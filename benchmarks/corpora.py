@@ -0,0 +1,124 @@
+"""Deterministic Japanese corpora for the benchmarks.
+
+Every corpus is generated from a fixed seed, so the same name, size and seed always
+give the same texts.
+"""
+
+import random
+from typing import Callable, Dict, List
+
+_LABELS = [
+    "{m}月{d}日締切",
+    "{m}/{d}更新",
+    "本日",
+    "明日の午後{h}時",
+    "来月末",
+    "令和{r}年{m}月{d}日",
+    "お知らせ",
+    "新着情報",
+    "{h}:{mi}開始",
+    "毎週{w}曜日",
+]
+
+_NEWS_SENTENCES = [
+    "政府は{y}年{m}月{d}日、新たな方針を発表した。",
+    "会見は午後{h}時から行われ、関係者が出席した。",
+    "担当者は「引き続き状況を注視する」と述べた。",
+    "前年の同じ時期と比べて、件数は大きく増えている。",
+    "次回の会合は来月{d}日に予定されている。",
+    "関係機関との調整を進めているという。",
+    "昨日の{h}時{mi}分ごろ、現場付近で通行止めが解除された。",
+    "専門家は慎重な対応が必要だと指摘している。",
+]
+
+_LOG_LINES = [
+    "{y}年{m}月{d}日 {h}:{mi} INFO ジョブを開始しました",
+    "{y}年{m}月{d}日 {h}:{mi} WARN 再試行します（{n}回目）",
+    "{y}年{m}月{d}日 {h}:{mi} INFO 処理件数: {n}件",
+    "{y}年{m}月{d}日 {h}:{mi} ERROR 接続がタイムアウトしました",
+]
+
+_PLAIN_SENTENCES = [
+    "ありがとうございました。",
+    "この文章には日付が含まれていません。",
+    "詳しくは担当者までお問い合わせください。",
+    "資料を共有しますので、ご確認をお願いします。",
+    "よろしくお願いいたします。",
+    "引き続き検討を進めていきます。",
+]
+
+_DENSE_EXPRESSIONS = [
+    "{y}年{m}月{d}日",
+    "令和{r}年{m}月{d}日（{w}）",
+    "{m}月{d}日{h}時{mi}分",
+    "午後{h}時半",
+    "昨日",
+    "来年",
+    "{d}日（{w}）",
+    "{h}:{mi}",
+]
+
+_DOWS = "月火水木金土日"
+
+
+def _fill(rng: random.Random, template: str) -> str:
+    return template.format(
+        y=rng.randint(1990, 2030),
+        r=rng.randint(1, 5),
+        m=rng.randint(1, 12),
+        d=rng.randint(1, 28),
+        h=rng.randint(0, 11),
+        mi=f"{rng.randint(0, 59):02d}",
+        w=rng.choice(_DOWS),
+        n=rng.randint(1, 999),
+    )
+
+
+def short_labels(size: int, seed: int = 0) -> List[str]:
+    """UI labels and message templates, many of which repeat."""
+    rng = random.Random(seed)
+    # Labels repeat heavily in practice, so they are drawn from a small pool.
+    pool = [_fill(rng, rng.choice(_LABELS)) for _ in range(50)]
+    return [rng.choice(pool) for _ in range(size)]
+
+
+def news(size: int, seed: int = 0) -> List[str]:
+    """Paragraphs of news-like sentences, some of which have time expressions."""
+    rng = random.Random(seed)
+    return [
+        "".join(_fill(rng, rng.choice(_NEWS_SENTENCES)) for _ in range(8))
+        for _ in range(size)
+    ]
+
+
+def logs(size: int, seed: int = 0) -> List[str]:
+    """Long log texts of 1000 lines each."""
+    rng = random.Random(seed)
+    return [
+        "\n".join(_fill(rng, rng.choice(_LOG_LINES)) for _ in range(1000))
+        for _ in range(size)
+    ]
+
+
+def no_time(size: int, seed: int = 0) -> List[str]:
+    """Paragraphs without any time expression."""
+    rng = random.Random(seed)
+    return ["".join(rng.choices(_PLAIN_SENTENCES, k=8)) for _ in range(size)]
+
+
+def dense(size: int, seed: int = 0) -> List[str]:
+    """Texts made almost only of time expressions."""
+    rng = random.Random(seed)
+    return [
+        "、".join(_fill(rng, rng.choice(_DENSE_EXPRESSIONS)) for _ in range(20))
+        for _ in range(size)
+    ]
+
+
+CORPORA: Dict[str, Callable[[int, int], List[str]]] = {
+    "short_labels": short_labels,
+    "news": news,
+    "logs": logs,
+    "no_time": no_time,
+    "dense": dense,
+}
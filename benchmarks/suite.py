@@ -0,0 +1,430 @@
+"""Run the benchmark suite and print the results as JSON.
+
+Each case runs an operation over a deterministic corpus (see ``corpora.py``) and
+reports the operations per second, the 50th and 99th percentile latencies of one
+operation, and the peak memory allocated while running it (measured in a separate
+pass, as tracing slows the code down). An operation is one document unless the
+name of the case says otherwise, e.g. a batch of documents or a column of values.
+Cases that do the same work in different ways, such as ``analyze`` and
+``analyze_records``, run over the same documents, so they can be compared.
+
+Usage: python benchmarks/suite.py [--quick] [--filter TEXT] [--output FILE]
+"""
+
+import argparse
+import datetime
+import functools
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, NamedTuple, Sequence, Tuple
+
+from corpora import CORPORA
+
+from jatime import __version__
+from jatime.analyzer import (
+    analyze,
+    analyze_many,
+    analyze_parallel,
+    analyze_records,
+    analyze_spans,
+    clear_resolution_cache,
+    contains_time_expression,
+    count_time_expressions,
+    split,
+)
+from jatime.arrays import MISSING, new_column
+from jatime.cache import AnalysisCache
+from jatime.columns import analyze_columns
+from jatime.converter import (
+    _parse_numeral,
+    ja_hour_to_24_hour,
+    ja_hours_to_24_hours,
+    ja_num_to_int,
+    ja_nums_to_ints,
+    jp_year_to_ad_year,
+    jp_years_to_ad_years,
+)
+from jatime.errors import InvalidValueError
+from jatime.finder import (
+    _search_year,
+    _search_year_month,
+    year_from_month_day_dow,
+    year_month_from_day_dow,
+)
+from jatime.patterns import compiled_patterns, warmup
+from jatime.scanner import finditer
+from jatime.stream import analyze_file, analyze_stream
+from jatime.times import DateTime
+
+BASE = datetime.datetime(2020, 10, 17)
+
+# Number of documents of each corpus
+SIZES = {"short_labels": 5000, "news": 1000, "logs": 5, "no_time": 2000, "dense": 500}
+QUICK_SIZES = {"short_labels": 500, "news": 100, "logs": 1, "no_time": 200, "dense": 50}
+
+# Number of documents per operation of the batch cases
+BATCH = 100
+
+# Number of characters per chunk of the stream cases
+CHUNK_SIZE = 4096
+
+# Number of values per operation of the converter cases
+COLUMN = 1000
+
+# Numeral groups of a time expression
+NUMERALS = ("ad_year", "month", "day", "hour", "minute")
+
+
+class Case(NamedTuple):
+    name: str
+    corpus: str
+    # Called before each pass, e.g. to clear caches
+    setup: Callable[[], None]
+    # The operation and its arguments, one call per operation
+    func: Callable
+    args: Sequence[Tuple]
+
+
+def _nothing() -> None:
+    pass
+
+
+def _consume(iterator) -> None:
+    for _ in iterator:
+        pass
+
+
+def _call_all(func: Callable, args: Sequence[Tuple]) -> None:
+    for a in args:
+        func(*a)
+
+
+def _batches(items: List, size: int) -> List[List]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _analysis_cases(name: str, texts: List[str]) -> Iterator[Case]:
+    args = [(text, BASE) for text in texts]
+    for func in (analyze, analyze_spans, analyze_records):
+        yield Case(func.__name__, name, clear_resolution_cache, func, args)
+    cache = AnalysisCache(maxsize=1024)
+    # Repeated documents are answered from the cache.
+    yield Case("AnalysisCache.analyze", name, cache.clear, cache.analyze, args)
+    patterns = compiled_patterns()
+    yield Case("split", name, _nothing, split, [(t, patterns) for t in texts])
+    for func in (contains_time_expression, count_time_expressions):
+        yield Case(func.__name__, name, _nothing, func, [(t,) for t in texts])
+
+
+def _analyze_many(texts: List[str]) -> None:
+    _consume(analyze_many(texts, BASE))
+
+
+def _analyze_columns(texts: List[str]) -> None:
+    analyze_columns(texts, BASE)
+
+
+def _batch_cases(name: str, texts: List[str]) -> Iterator[Case]:
+    args = [(batch,) for batch in _batches(texts, BATCH)]
+    for func in (_analyze_many, _analyze_columns):
+        case_name = f"{func.__name__[1:]} ({BATCH} docs)"
+        yield Case(case_name, name, clear_resolution_cache, func, args)
+
+
+def _analyze_stream(chunks: List[str]) -> None:
+    _consume(analyze_stream(chunks, BASE, chunk_size=CHUNK_SIZE))
+
+
+def _analyze_file(path: str, mmap: bool) -> None:
+    _consume(analyze_file(path, BASE, mmap=mmap))
+
+
+def _analyze_parallel(texts: List[str], workers: int) -> None:
+    _consume(analyze_parallel(texts, workers=workers, base=BASE))
+
+
+def _io_cases(name: str, texts: List[str]) -> Iterator[Case]:
+    args = [(_batches(text, CHUNK_SIZE),) for text in texts]
+    yield Case("analyze_stream", name, clear_resolution_cache, _analyze_stream, args)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, f"{name}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(texts))
+        for mmap in (True, False):
+            case_name = f"analyze_file (all docs, mmap={mmap})"
+            args = [(path, mmap)]
+            yield Case(case_name, name, clear_resolution_cache, _analyze_file, args)
+
+
+def _parallel_cases(name: str, texts: List[str]) -> Iterator[Case]:
+    # The worker processes are started in each operation.
+    for workers in (1, 2):
+        case_name = f"analyze_parallel (all docs, workers={workers})"
+        args = [(texts, workers)]
+        yield Case(case_name, name, _nothing, _analyze_parallel, args)
+
+
+def _resolve(groups: Dict, base: datetime.datetime) -> None:
+    # Resolve every field, as the analyzer does.
+    try:
+        DateTime.from_groups(groups, base).to_tuple()
+    except InvalidValueError:
+        pass
+
+
+def _from_keywords(groups: Dict, base: datetime.datetime) -> None:
+    try:
+        DateTime(base=base, **groups).to_tuple()
+    except InvalidValueError:
+        pass
+
+
+def _from_match(m, base: datetime.datetime) -> None:
+    try:
+        DateTime.from_match(m, base).to_tuple()
+    except InvalidValueError:
+        pass
+
+
+def _parse_numeral_as_before(num) -> None:
+    # What ``ja_num_to_int`` did before it returned early for None: the string
+    # "None" was parsed.
+    _parse_numeral(str(num))
+
+
+def _resolution_cases(name: str, texts: List[str]) -> Iterator[Case]:
+    matches = [m for text in texts for m in finditer(text)]
+    groups = [(m.groupdict(), BASE) for m in matches]
+    match_args = [(m, BASE) for m in matches]
+    # Each case reads every field, as the year and month are estimated only when
+    # they are read. The lookup tables of the estimation are built on first use,
+    # which is not measured.
+    for case_name, func, args in (
+        ("DateTime resolution", _resolve, groups),
+        ("DateTime(**groups)", _from_keywords, groups),
+        ("DateTime.from_match", _from_match, match_args),
+    ):
+        warm = functools.partial(_call_all, func, args)
+        yield Case(case_name, name, warm, func, args)
+
+
+def _numeral_cases(name: str, texts: List[str]) -> Iterator[Case]:
+    groups = [m.groupdict() for text in texts for m in finditer(text)]
+    # Most numeral groups are left out of a time expression, so the conversion of
+    # None is compared with the parse that used to be done for it.
+    nums = [(g.get(n),) for g in groups for n in NUMERALS]
+    yield Case("ja_num_to_int (numeral groups)", name, _nothing, ja_num_to_int, nums)
+    nones = [num for num in nums if num[0] is None]
+    for case_name, func in (
+        ("ja_num_to_int (absent groups)", ja_num_to_int),
+        ("parse of str(None) (absent groups)", _parse_numeral_as_before),
+    ):
+        yield Case(case_name, name, _nothing, func, nones)
+
+
+def _finder_args(size: int) -> Tuple[List[Tuple], List[Tuple]]:
+    rng = random.Random(0)
+    year_args = []
+    while len(year_args) < size:
+        date = datetime.date(2020, 1, 1) + datetime.timedelta(rng.randrange(366))
+        year_args.append(
+            (date.month, date.day, rng.randrange(7), rng.randint(1990, 2050))
+        )
+    year_month_args = [
+        (
+            rng.randint(1, 31),
+            rng.randrange(7),
+            rng.randint(1990, 2050),
+            rng.randint(1, 12),
+        )
+        for _ in range(size)
+    ]
+    return year_args, year_month_args
+
+
+def _finder_cases(size: int) -> Iterator[Case]:
+    year_args, year_month_args = _finder_args(size)
+    for func, search, args in (
+        (year_from_month_day_dow, _search_year, year_args),
+        (year_month_from_day_dow, _search_year_month, year_month_args),
+    ):
+        # The lookup tables are built on first use, which is not measured.
+        warm = functools.partial(_call_all, func, args)
+        yield Case(func.__name__, "-", warm, func, args)
+        # The search that the lookup tables replace
+        yield Case(search.__name__, "-", _nothing, search, args)
+
+
+def _converter_columns(size: int) -> Dict[str, List]:
+    rng = random.Random(0)
+    choices = {
+        "years": ["一九九二", "2020", "２０２１", None],
+        "jp_years": ["令和元", "平成三十一", "昭和6", None],
+        "ampms": ["午前", "午後", "", None],
+        "hours": ["三", "１０", "9", None],
+    }
+    return {
+        name: [rng.choice(values) for _ in range(size)]
+        for name, values in choices.items()
+    }
+
+
+def _nums_each(nums: List) -> None:
+    column = new_column()
+    for num in nums:
+        value = ja_num_to_int(num)
+        column.append(MISSING if value is None else value)
+
+
+def _jp_years_each(jp_years: List) -> None:
+    column = new_column()
+    for jp_year in jp_years:
+        value = None if jp_year is None else jp_year_to_ad_year(jp_year)
+        column.append(MISSING if value is None else value)
+
+
+def _hours_each(ampms: List, hours: List) -> None:
+    column = new_column()
+    for ampm, hour in zip(ampms, map(ja_num_to_int, hours)):
+        if hour is not None and ampm is not None:
+            hour = ja_hour_to_24_hour(ampm, hour)
+        column.append(MISSING if hour is None else hour)
+
+
+def _converter_cases(size: int) -> Iterator[Case]:
+    columns = {
+        name: _batches(values, COLUMN)
+        for name, values in _converter_columns(size).items()
+    }
+    nums = [(c,) for c in columns["years"]]
+    jp_years = [(c,) for c in columns["jp_years"]]
+    hours = list(zip(columns["ampms"], columns["hours"]))
+    # The values converted one by one are put into a column as the bulk converters
+    # do.
+    for bulk, each, args in (
+        (ja_nums_to_ints, _nums_each, nums),
+        (jp_years_to_ad_years, _jp_years_each, jp_years),
+        (ja_hours_to_24_hours, _hours_each, hours),
+    ):
+        yield Case(f"{bulk.__name__} ({COLUMN} values)", "-", _nothing, bulk, args)
+        case_name = f"{bulk.__name__} one by one ({COLUMN} values)"
+        yield Case(case_name, "-", _nothing, each, args)
+
+
+def _get_analysis(client, string: str) -> None:
+    response = client.get("/analysis", query_string={"string": string})
+    assert response.status_code == 200
+
+
+def _server_cases(corpora: Dict[str, List[str]]) -> Iterator[Case]:
+    try:
+        from jatime.server import app
+    except ImportError:  # pragma: no cover
+        return
+    client = app.test_client()
+    for name in ("short_labels", "news"):
+        args = [(client, text) for text in corpora[name]]
+        yield Case("GET /analysis", name, clear_resolution_cache, _get_analysis, args)
+
+
+def cases(sizes: Dict[str, int]) -> Iterator[Case]:
+    corpora = {name: CORPORA[name](size) for name, size in sizes.items()}
+    for name, texts in corpora.items():
+        yield from _analysis_cases(name, texts)
+    for name in ("short_labels", "news", "dense"):
+        yield from _batch_cases(name, corpora[name])
+    for name in ("logs", "dense"):
+        yield from _io_cases(name, corpora[name])
+    yield from _parallel_cases("news", corpora["news"])
+    for name in ("news", "dense"):
+        yield from _resolution_cases(name, corpora[name])
+        yield from _numeral_cases(name, corpora[name])
+    yield from _finder_cases(sizes["short_labels"])
+    yield from _converter_cases(sizes["short_labels"] * 40)
+    yield from _server_cases(corpora)
+
+
+def _percentile(latencies: List[float], q: float) -> float:
+    return latencies[min(len(latencies) - 1, int(len(latencies) * q))]
+
+
+def run(case: Case) -> Dict:
+    # Time each operation.
+    case.setup()
+    latencies = []
+    gc.collect()
+    for args in case.args:
+        start = time.perf_counter()
+        case.func(*args)
+        latencies.append(time.perf_counter() - start)
+    total = sum(latencies)
+    latencies.sort()
+
+    # Measure the memory in a separate pass.
+    case.setup()
+    gc.collect()
+    tracemalloc.start()
+    for args in case.args:
+        case.func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "name": case.name,
+        "corpus": case.corpus,
+        "ops": len(latencies),
+        "ops_per_sec": len(latencies) / total if total else None,
+        "p50_us": _percentile(latencies, 0.5) * 1e6 if latencies else None,
+        "p99_us": _percentile(latencies, 0.99) * 1e6 if latencies else None,
+        "peak_memory_bytes": peak,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="use small corpora")
+    parser.add_argument("--filter", default="", help="run only matching cases")
+    parser.add_argument("--output", help="write the results to this file")
+    options = parser.parse_args()
+
+    warmup()
+    results = []
+    for case in cases(QUICK_SIZES if options.quick else SIZES):
+        if options.filter not in f"{case.name} {case.corpus}":
+            continue
+        result = run(case)
+        results.append(result)
+        ops_per_sec = result["ops_per_sec"] or 0
+        print(
+            f"{case.name:<46} {case.corpus:<13} {ops_per_sec:12.1f} ops/s",
+            file=sys.stderr,
+        )
+
+    output = json.dumps(
+        {
+            "jatime": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": options.quick,
+            "results": results,
+        },
+        indent=2,
+        ensure_ascii=False,
+    )
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,18 @@
+import collections
 import datetime
+import functools
+import itertools
+import os
 import re
-from typing import Dict, List, Optional, Union
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from jatime.errors import InvalidValueError
-from jatime.patterns import datetime_patterns
+from jatime.patterns import component_lookaheads, possible_components, warmup
+from jatime.records import Extraction, TimeExpression
+from jatime.scanner import finditer, scan
+from jatime.stats import component_recorder, ordered_components
 from jatime.times import DateTime
 
 
@@ -32,25 +41,389 @@ def split(string: str, patterns) -> List:
     return pieces
 
 
+# DateTime の解決結果のキャッシュの大きさ
+RESOLUTION_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=RESOLUTION_CACHE_SIZE)
+def _resolve_cached(
+    groups: Tuple[Tuple[str, Optional[str]], ...], date: datetime.date
+) -> Tuple[Optional[Union[int, str]], ...]:
+    # DateTime depends on the base time only through its date.
+    base = datetime.datetime(date.year, date.month, date.day)
+    try:
+        return DateTime.from_groups(dict(groups), base).to_tuple() + (None,)
+    except InvalidValueError as e:
+        return (None,) * len(DateTime.ATTRS) + (str(e),)
+
+
+def _resolve_tuple(
+    groups: Dict[str, str], base: datetime.datetime
+) -> Tuple[Optional[Union[int, str]], ...]:
+    return _resolve_cached(tuple(groups.items()), base.date())
+
+
+def _resolve(groups: Dict[str, str], base: datetime.datetime) -> Dict:
+    values = _resolve_tuple(groups, base)
+    if values[-1] is not None:
+        return {"error": values[-1]}
+    return dict(zip(DateTime.ATTRS, values))
+
+
+def resolution_cache_info() -> Tuple[int, int, int, int]:
+    """Return the statistics of the cache of resolved time expressions.
+
+    Time expressions are resolved once for each combination of their named groups
+    and the date of the base time, and the last ``RESOLUTION_CACHE_SIZE`` of them are
+    kept, so repeated expressions skip the conversion entirely.
+
+    Returns
+    -------
+    tuple of int
+        ``hits``, ``misses``, ``maxsize`` and ``currsize`` as ``functools.lru_cache``.
+    """
+    return _resolve_cached.cache_info()
+
+
+def clear_resolution_cache() -> None:
+    """Clear the cache of resolved time expressions and its statistics."""
+    _resolve_cached.cache_clear()
+
+
+def _analyze(string: str, base: datetime.datetime) -> List[Union[str, Dict]]:
+    result = []
+    pieces = scan(string)
+    for p in pieces:
+        if type(p) == str:
+            result.append(p)
+            continue
+
+        dic = {"string": p.group()}
+        dic.update(_resolve(p.groupdict(), base))
+        result.append(dic)
+        # TODO: update base time (?)
+    return result
+
+
 def analyze(
     string: str, base: Optional[datetime.datetime] = None
 ) -> List[Union[str, Dict]]:
     if base is None:
         base = datetime.datetime.now()
 
-    result = []
-    pieces = split(string, datetime_patterns())
-    for p in pieces:
+    return _analyze(string, base)
+
+
+def extract(string: str) -> List[Union[str, Extraction]]:
+    """Find the time expressions in the string without resolving them.
+
+    This is the part of ``analyze`` that does not depend on the base time. Pass the
+    result to ``resolve``, possibly several times with different base times, to get
+    the result of ``analyze``.
+
+    Parameters
+    ----------
+    string : str
+        The string to be analyzed.
+
+    Returns
+    -------
+    list of str or Extraction
+        The same pieces as ``analyze``, where time expressions are ``Extraction``.
+
+    Examples
+    --------
+    >>> [p if type(p) == str else p.string for p in extract("昨日は十月十七日でした。")]
+    ['昨日', 'は', '十月十七日', 'でした。']
+    """
+    return [
+        p if type(p) == str else Extraction(p.group(), p.groupdict())
+        for p in scan(string)
+    ]
+
+
+def resolve(
+    extraction: Iterable[Union[str, Extraction]],
+    base: Optional[datetime.datetime] = None,
+) -> List[Union[str, Dict]]:
+    """Resolve the time expressions found by ``extract`` against the base time.
+
+    ``resolve(extract(string), base)`` is the same as ``analyze(string, base)``, but
+    no pattern matching is done here.
+
+    Parameters
+    ----------
+    extraction : iterable of str or Extraction
+        The result of ``extract``.
+    base : datetime.datetime, optional
+        The base time of the analysis (the default is the time of the call).
+
+    Returns
+    -------
+    list of str or dict
+        The same as the result of ``analyze``.
+
+    Examples
+    --------
+    >>> extraction = extract("昨日")
+    >>> resolve(extraction, datetime.datetime(2020, 10, 17))[0]["day"]
+    16
+    >>> resolve(extraction, datetime.datetime(2020, 11, 1))[0]["day"]
+    31
+    """
+    if base is None:
+        base = datetime.datetime.now()
+
+    result: List[Union[str, Dict]] = []
+    for p in extraction:
         if type(p) == str:
             result.append(p)
             continue
 
-        dic = {"string": p.group()}
-        try:
-            dt = DateTime(base=base, **p.groupdict())
-            dic.update(dt.to_dict())
-        except InvalidValueError as e:
-            dic["error"] = str(e)
+        dic = {"string": p.string}
+        dic.update(_resolve(p.groups, base))
         result.append(dic)
-        # TODO: update base time (?)
     return result
+
+
+def analyze_spans(
+    string: str, base: Optional[datetime.datetime] = None
+) -> List[Tuple[Optional[Union[int, str]], ...]]:
+    """Analyze the string, returning only the spans and values of time expressions.
+
+    Unlike ``analyze``, neither the time expressions nor the rest of the string are
+    copied, which saves much memory on long strings.
+
+    Parameters
+    ----------
+    string : str
+        The string to be analyzed.
+    base : datetime.datetime, optional
+        The base time of the analysis (the default is the time of the call).
+
+    Returns
+    -------
+    list of tuple
+        ``(start, end, year, month, day, dow, hour, minute, error)`` for each time
+        expression, where ``string[start:end]`` is the time expression and ``error``
+        is None unless it is inconsistent, in which case the values are None.
+
+    Examples
+    --------
+    >>> analyze_spans("それは令和２年十月十七日の出来事でした。")
+    [(3, 12, 2020, 10, 17, 5, None, None, None)]
+    """
+    if base is None:
+        base = datetime.datetime.now()
+
+    return [
+        (m.start(), m.end()) + _resolve_tuple(m.groupdict(), base)
+        for m in finditer(string)
+    ]
+
+
+def analyze_records(
+    string: str, base: Optional[datetime.datetime] = None
+) -> List[TimeExpression]:
+    """Analyze the string, returning compact records of the time expressions.
+
+    This is the same as ``analyze_spans`` except that each time expression is a
+    ``TimeExpression``, which can be turned into the dict of ``analyze`` on demand.
+
+    Parameters
+    ----------
+    string : str
+        The string to be analyzed.
+    base : datetime.datetime, optional
+        The base time of the analysis (the default is the time of the call).
+
+    Returns
+    -------
+    list of TimeExpression
+        The time expressions from left to right.
+
+    Examples
+    --------
+    >>> string = "それは令和２年十月十七日の出来事でした。"
+    >>> [(te.year, te.month, te.day) for te in analyze_records(string)]
+    [(2020, 10, 17)]
+    >>> analyze_records(string)[0].to_dict(string) == analyze(string)[1]
+    True
+    """
+    if base is None:
+        base = datetime.datetime.now()
+
+    return [
+        TimeExpression(m.start(), m.end(), *_resolve_tuple(m.groupdict(), base))
+        for m in finditer(string)
+    ]
+
+
+def analyze_many(
+    strings: Iterable[str], base: Optional[datetime.datetime] = None
+) -> Iterator[List[Union[str, Dict]]]:
+    """Analyze each of the strings against the same base time.
+
+    This is the same as ``[analyze(s, base) for s in strings]``, except that the
+    results are yielded lazily, and that the default base time is taken once for
+    all the strings. The work per string is the same as that of ``analyze``, whose
+    patterns and resolution results are shared by all calls anyway.
+
+    Parameters
+    ----------
+    strings : iterable of str
+        The strings to be analyzed. It can be a sequence or an iterator.
+    base : datetime.datetime, optional
+        The base time of the analysis (the default is the time of the call).
+
+    Returns
+    -------
+    iterator of list of str or dict
+        The result of ``analyze`` for each string, in the same order.
+
+    Examples
+    --------
+    >>> base = datetime.datetime(2020, 10, 17)
+    >>> results = analyze_many(["昨日", "十月一日", "あ"], base)
+    >>> [[r if type(r) == str else r["day"] for r in result] for result in results]
+    [[16], [1], ['あ']]
+    """
+    if base is None:
+        base = datetime.datetime.now()
+    warmup()
+
+    return (_analyze(string, base) for string in strings)
+
+
+def _chunks(strings: Iterable[str], size: int) -> Iterator[List[str]]:
+    iterator = iter(strings)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _analyze_chunk(
+    strings: List[str], base: datetime.datetime
+) -> List[List[Union[str, Dict]]]:
+    # Compiles the patterns only on the first chunk of each worker process.
+    warmup()
+    return [_analyze(string, base) for string in strings]
+
+
+def analyze_parallel(
+    strings: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    base: Optional[datetime.datetime] = None,
+) -> Iterator[List[Union[str, Dict]]]:
+    """Analyze each of the strings in parallel with worker processes.
+
+    The strings are sent to the workers in chunks, and only a few chunks per worker
+    are in flight at a time, so that an arbitrarily long iterator can be analyzed.
+
+    Parameters
+    ----------
+    strings : iterable of str
+        The strings to be analyzed. It can be a sequence or an iterator.
+    workers : int, optional
+        The number of worker processes (the default is the number of CPUs).
+    chunksize : int, optional
+        The number of strings sent to a worker at a time (the default is 64).
+    base : datetime.datetime, optional
+        The base time of the analysis (the default is the time of the call).
+
+    Returns
+    -------
+    iterator of list of str or dict
+        The result of ``analyze`` for each string, in the same order as
+        ``strings``.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be positive, but {workers} was given.")
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be positive, but {chunksize} was given.")
+    if base is None:
+        base = datetime.datetime.now()
+
+    return _analyze_parallel(strings, workers, chunksize, base)
+
+
+def _analyze_parallel(
+    strings: Iterable[str], workers: int, chunksize: int, base: datetime.datetime
+) -> Iterator[List[Union[str, Dict]]]:
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[Future] = collections.deque()
+        for chunk in _chunks(strings, chunksize):
+            pending.append(executor.submit(_analyze_chunk, chunk, base))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def contains_time_expression(string: str) -> bool:
+    """Return whether the string contains any time expression.
+
+    Every notation of a year, month, day, day of the week or time is a time
+    expression on its own, so the search stops at the first notation found. No
+    time expressions are resolved.
+
+    Parameters
+    ----------
+    string : str
+        The string to be checked.
+
+    Returns
+    -------
+    bool
+        True if ``analyze(string)`` contains at least one time expression.
+
+    Examples
+    --------
+    >>> contains_time_expression("それは令和２年十月十七日の出来事でした。")
+    True
+    >>> contains_time_expression("ありがとうございました。")
+    False
+    """
+    lookaheads = component_lookaheads()
+    record = component_recorder()
+    # Whether any of them is found does not depend on the order, so they may be
+    # searched in order of observed hit rate (see ``jatime.stats``).
+    for i in ordered_components(possible_components(string)):
+        if record is None:
+            found = lookaheads[i].search(string) is not None
+        else:
+            t = time.perf_counter()
+            found = lookaheads[i].search(string) is not None
+            record(i, found, time.perf_counter() - t)
+        if found:
+            return True
+    return False
+
+
+def count_time_expressions(string: str) -> int:
+    """Return the number of time expressions in the string.
+
+    The time expressions are found in the same way as ``analyze``, but they are
+    neither resolved nor copied.
+
+    Parameters
+    ----------
+    string : str
+        The string to be checked.
+
+    Returns
+    -------
+    int
+        The number of time expressions in ``analyze(string)``.
+
+    Examples
+    --------
+    >>> count_time_expressions("昨日は十月十七日でした。")
+    2
+    """
+    return sum(1 for _ in finditer(string))
@@ -0,0 +1,54 @@
+import array
+import functools
+from typing import Any, Optional
+
+# 値が None であることを表す番兵
+MISSING = -1
+
+# 整数列の型コード（符号付き 64 ビット整数）
+TYPECODE = "q"
+
+
+def new_column() -> array.array:
+    """Return an empty column of integers."""
+    return array.array(TYPECODE)
+
+
+def numpy_module(use_numpy: Optional[bool] = None) -> Any:
+    """Return the numpy module, or None if it is not to be used.
+
+    Parameters
+    ----------
+    use_numpy : bool, optional
+        Whether to use NumPy (the default is to do so if it is installed). If True,
+        NumPy must be installed.
+
+    Raises
+    ------
+    ImportError
+        If ``use_numpy`` is True and NumPy is not installed.
+    """
+    if use_numpy is False:
+        return None
+    numpy = _import_numpy()
+    if numpy is None and use_numpy:
+        raise ImportError("NumPy is required but not installed.")
+    return numpy
+
+
+@functools.lru_cache(maxsize=None)
+def _import_numpy() -> Any:
+    # Python does not remember a failed import, so it is only tried once here.
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def to_vector(column: array.array, numpy: Any) -> Any:
+    """Return the column as a NumPy array sharing its buffer, or as it is if
+    ``numpy`` is None."""
+    if numpy is None:
+        return column
+    return numpy.frombuffer(column, dtype=numpy.int64)
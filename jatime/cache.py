@@ -0,0 +1,103 @@
+import collections
+import datetime
+import threading
+from typing import Dict, List, NamedTuple, Optional, Union
+
+from jatime.analyzer import _analyze
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class AnalysisCache(object):
+    """A bounded LRU cache of the results of ``analyze``.
+
+    The result of ``analyze`` depends on the base time only through its date, so
+    results are cached by the string and the date of the base time. A cache is
+    opt-in: create one and call its ``analyze`` instead of ``jatime.analyzer.analyze``.
+    It can be shared between threads.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of results kept (the default is 1024). The least recently
+        used result is evicted first.
+
+    Examples
+    --------
+    >>> cache = AnalysisCache(maxsize=2)
+    >>> base = datetime.datetime(2020, 10, 17, 9)
+    >>> cache.analyze("昨日", base)[0]["day"]
+    16
+    >>> cache.analyze("昨日", base.replace(hour=21))[0]["day"]
+    16
+    >>> cache.info()
+    CacheInfo(hits=1, misses=1, evictions=0, maxsize=2, currsize=1)
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, but {maxsize} was given.")
+        self.maxsize = maxsize
+        # (string, date of the base time) -> result, least recently used first
+        self._results = collections.OrderedDict()  # type: collections.OrderedDict
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def analyze(
+        self, string: str, base: Optional[datetime.datetime] = None
+    ) -> List[Union[str, Dict]]:
+        """Return the same as ``analyze(string, base)``, from the cache if possible.
+
+        The returned list and dicts are copies, so modifying them does not affect
+        the cache.
+        """
+        if base is None:
+            base = datetime.datetime.now()
+
+        key = (string, base.date())
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                self._hits += 1
+                return _copy(result)
+            self._misses += 1
+
+        # Analyze outside of the lock so that other threads are not blocked.
+        result = _analyze(string, base)
+        with self._lock:
+            if key not in self._results:
+                self._results[key] = result
+                if len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+                    self._evictions += 1
+        return _copy(result)
+
+    def info(self) -> CacheInfo:
+        """Return the hit, miss and eviction counts and the size of the cache."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._results),
+            )
+
+    def clear(self) -> None:
+        """Remove all the results and reset the counts."""
+        with self._lock:
+            self._results.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+def _copy(result: List[Union[str, Dict]]) -> List[Union[str, Dict]]:
+    return [p if type(p) == str else dict(p) for p in result]
@@ -0,0 +1,75 @@
+import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from jatime.analyzer import _resolve_tuple
+from jatime.arrays import MISSING, new_column, numpy_module, to_vector
+from jatime.patterns import warmup
+from jatime.scanner import finditer
+from jatime.times import DateTime
+
+# 列の名前（順序は固定）
+COLUMNS = ["doc_index", "start", "end"] + DateTime.ATTRS
+
+
+def _append_rows(
+    appends: List[Callable[[int], None]],
+    doc_index: int,
+    string: str,
+    base: datetime.datetime,
+) -> None:
+    # Appends a row to the columns for each time expression in the string.
+    for m in finditer(string):
+        values = _resolve_tuple(m.groupdict(), base)[:-1]
+        row = (doc_index, m.start(), m.end()) + values
+        for append, value in zip(appends, row):
+            append(MISSING if value is None else value)
+
+
+def analyze_columns(
+    strings: Iterable[str],
+    base: Optional[datetime.datetime] = None,
+    use_numpy: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """Analyze the strings, returning the time expressions as columns.
+
+    Each time expression in the strings is a row, and each item of ``COLUMNS`` is a
+    column of integers, so no Python object is kept per time expression. A value of
+    None, including the values of an inconsistent time expression, is ``MISSING``.
+
+    Parameters
+    ----------
+    strings : iterable of str
+        The strings to be analyzed.
+    base : datetime.datetime, optional
+        The base time of the analysis (the default is the time of the call).
+    use_numpy : bool, optional
+        Whether to return NumPy arrays instead of ``array.array`` (the default is to
+        do so if NumPy is installed). If True, NumPy must be installed.
+
+    Returns
+    -------
+    dict
+        The columns by name. ``doc_index`` is the position of the string in
+        ``strings``, and ``start`` and ``end`` are the span in that string.
+
+    Examples
+    --------
+    >>> strings = ["令和２年十月十七日", "何もない", "昨日と明日"]
+    >>> base = datetime.datetime(2020, 10, 17)
+    >>> columns = analyze_columns(strings, base, use_numpy=False)
+    >>> list(columns["doc_index"]), list(columns["day"])
+    ([0, 2, 2], [17, 16, 18])
+    >>> list(columns["hour"])
+    [-1, -1, -1]
+    """
+    numpy = numpy_module(use_numpy)
+    if base is None:
+        base = datetime.datetime.now()
+    warmup()
+
+    columns = {name: new_column() for name in COLUMNS}
+    appends = [columns[name].append for name in COLUMNS]
+    for i, string in enumerate(strings):
+        _append_rows(appends, i, string, base)
+
+    return {name: to_vector(column, numpy) for name, column in columns.items()}
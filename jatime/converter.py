@@ -1,5 +1,51 @@
 import datetime
-from typing import Callable, Dict, Optional, Tuple, Union
+import itertools
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple, Union
+
+from jatime.arrays import MISSING, new_column, numpy_module, to_vector
+
+# 特別な読みをする数字表記
+_SPECIAL_NUMERALS = {"零": 0, "元": 1, "十": 10, "拾": 10, "半": 30}
+
+# 漢数字から算用数字への変換表
+_KANJI_DIGITS = str.maketrans("〇一二三四五六七八九十拾", "012345678911")
+
+
+def _parse_numeral(num: str) -> Optional[int]:
+    if len(num) == 0:
+        return None
+
+    if num in _SPECIAL_NUMERALS.keys():
+        return _SPECIAL_NUMERALS[num]
+
+    num = num[:-1] + num[-1].replace("十", "0").replace("拾", "0")
+    num = num[0] + num[1:].replace("十", "").replace("拾", "")
+    num = num.translate(_KANJI_DIGITS)
+
+    try:
+        return int(num)
+    except ValueError:
+        return None
+
+
+def _numeral_table() -> Dict[str, int]:
+    digits = "0123456789０１２３４５６７８９"
+    kanji = "〇一二三四五六七八九十拾"
+    strings = itertools.chain(
+        _SPECIAL_NUMERALS.keys(),
+        ("".join(p) for n in (1, 2) for p in itertools.product(digits, repeat=n)),
+        ("".join(p) for n in (1, 2, 3) for p in itertools.product(kanji, repeat=n)),
+    )
+    table = {}
+    for num in strings:
+        value = _parse_numeral(num)
+        if value is not None:
+            table[num] = value
+    return table
+
+
+# 月・日・時・分・和暦年の数字表記（3 文字以下）とその値
+_NUMERALS = _numeral_table()
 
 
 def ja_num_to_int(num: Union[int, str]) -> Optional[int]:
@@ -10,6 +56,8 @@ def ja_num_to_int(num: Union[int, str]) -> Optional[int]:
     * "半" is specially converted to 30.
     * This function supports expressions with 4 or fewer digits, not including
       "百" and "千".
+    * The numerals that the patterns accept for month, day, hour, minute and the
+      Japanese year are looked up in a precomputed table.
 
     Parameters
     ----------
@@ -26,25 +74,23 @@ def ja_num_to_int(num: Union[int, str]) -> Optional[int]:
     >>> [ja_num_to_int(n) for n in (1, "零", "六七", "八十九", "二〇二〇", "半", "あ")]
     [1, 0, 67, 89, 2020, 30, None]
     """
-    if type(num) == int:
+    if type(num) == int or num is None:
         return num
+    if type(num) == str:
+        value = _NUMERALS.get(num)
+        if value is not None:
+            return value
+    return _parse_numeral(str(num))
 
-    num = str(num)
-    if len(num) == 0:
-        return None
-
-    specials = {"零": 0, "元": 1, "十": 10, "拾": 10, "半": 30}
-    if num in specials.keys():
-        return specials[num]
-
-    num = num[:-1] + num[-1].replace("十", "0").replace("拾", "0")
-    num = num[0] + num[1:].replace("十", "").replace("拾", "")
-    num = num.translate(str.maketrans("〇一二三四五六七八九十拾", "012345678911"))
 
-    try:
-        return int(num)
-    except ValueError:
-        return None
+# 年号: (最終年, 最終年に対応する西暦年)
+_ERAS = {
+    "明治": (45, 1912),
+    "大正": (15, 1926),
+    "昭和": (64, 1989),
+    "平成": (31, 2019),
+    "令和": (50, 2068),
+}
 
 
 def jp_year_to_ad_year(jp_year: str) -> Optional[int]:
@@ -74,25 +120,36 @@ def jp_year_to_ad_year(jp_year: str) -> Optional[int]:
 
     >>> assert jp_year_to_ad_year("昭和65") is None
     """
+    ad_year = _JP_YEARS.get(jp_year)
+    if ad_year is not None:
+        return ad_year
+    return _convert_jp_year(jp_year)
+
+
+def _convert_jp_year(jp_year: str) -> Optional[int]:
     era = jp_year[:2]
-    year = jp_year[2:]
-    data = {
-        # 年号: (最終年, 最終年に対応する西暦年)
-        "明治": (45, 1912),
-        "大正": (15, 1926),
-        "昭和": (64, 1989),
-        "平成": (31, 2019),
-        "令和": (50, 2068),
-    }
-    if era not in data.keys():
+    if era not in _ERAS.keys():
         return None
-    year = ja_num_to_int(year)
+    year = ja_num_to_int(jp_year[2:])
     if year is None:
         return None
-    diff = data[era][0] - year
+    diff = _ERAS[era][0] - year
     if diff < 0:
         return None
-    return data[era][1] - diff
+    return _ERAS[era][1] - diff
+
+
+def _jp_year_table() -> Dict[str, int]:
+    table = {}
+    for era, num in itertools.product(_ERAS.keys(), _NUMERALS.keys()):
+        ad_year = _convert_jp_year(era + num)
+        if ad_year is not None:
+            table[era + num] = ad_year
+    return table
+
+
+# 和暦年の表記（年の数字が 3 文字以下）とその西暦年
+_JP_YEARS = _jp_year_table()
 
 
 def _relative_to_absolute(data: Dict[str, int]) -> Callable[[str, int], Optional[int]]:
@@ -105,6 +162,39 @@ def _relative_to_absolute(data: Dict[str, int]) -> Callable[[str, int], Optional
     return converter
 
 
+# 相対的な年表現: 基準年からの差
+_RELATIVE_YEARS = {
+    "一昨年": -2,
+    "昨年": -1,
+    "去年": -1,
+    "今年": 0,
+    "来年": 1,
+    "再来年": 2,
+}
+
+# 相対的な月表現: 基準月からの差
+_RELATIVE_MONTHS = {
+    "先々月": -2,
+    "先月": -1,
+    "今月": 0,
+    "来月": 1,
+    "再来月": 2,
+}
+
+_relative_year_to_absolute = _relative_to_absolute(_RELATIVE_YEARS)
+_relative_month_to_absolute = _relative_to_absolute(_RELATIVE_MONTHS)
+
+# 相対的な日表現: 基準日からの差
+_RELATIVE_DAYS = {
+    "一昨日": datetime.timedelta(days=-2),
+    "昨日": datetime.timedelta(days=-1),
+    "今日": datetime.timedelta(days=0),
+    "本日": datetime.timedelta(days=0),
+    "明日": datetime.timedelta(days=1),
+    "明後日": datetime.timedelta(days=2),
+}
+
+
 def relative_year_into_absolute(relative_year: str, base_year: int) -> Optional[int]:
     """Convert a relative expression of the year into an absolute one.
 
@@ -129,15 +219,7 @@ def relative_year_into_absolute(relative_year: str, base_year: int) -> Optional[
     >>> relative_year_into_absolute("一昨年", 2020)
     2018
     """
-    data = {
-        "一昨年": -2,
-        "昨年": -1,
-        "去年": -1,
-        "今年": 0,
-        "来年": 1,
-        "再来年": 2,
-    }
-    return _relative_to_absolute(data)(relative_year, base_year)
+    return _relative_year_to_absolute(relative_year, base_year)
 
 
 def relative_month_into_absolute(
@@ -172,14 +254,7 @@ def relative_month_into_absolute(
     (2021, 2)
     """
     assert type(base_year) == int
-    data = {
-        "先々月": -2,
-        "先月": -1,
-        "今月": 0,
-        "来月": 1,
-        "再来月": 2,
-    }
-    month = _relative_to_absolute(data)(relative_month, base_month)
+    month = _relative_month_to_absolute(relative_month, base_month)
     if month is None:
         return None
     if month < 1:
@@ -224,11 +299,10 @@ def relative_day_into_absolute(
     >>> relative_day_into_absolute("昨日", 2021, 3, 1)
     (2021, 2, 28)
     """
-    data = {"一昨日": -2, "昨日": -1, "今日": 0, "本日": 0, "明日": 1, "明後日": 2}
-    if relative_day not in data.keys():
+    if relative_day not in _RELATIVE_DAYS.keys():
         return None
     base = datetime.date(base_year, base_month, base_day)
-    date = base + datetime.timedelta(days=data[relative_day])
+    date = base + _RELATIVE_DAYS[relative_day]
     return date.year, date.month, date.day
 
 
@@ -263,3 +337,125 @@ def ja_hour_to_24_hour(ampm: str, hour: int) -> int:
     if "午後" in ampm or ampm.startswith(("p", "ｐ", "P", "Ｐ")):
         hour += 12
     return hour
+
+
+def _convert_all(
+    values: Iterable[Hashable],
+    convert: Callable[..., Optional[int]],
+    use_numpy: Optional[bool],
+) -> Any:
+    # Convert each distinct value once, in the order of the values.
+    numpy = numpy_module(use_numpy)
+    converted: Dict[Hashable, int] = {None: MISSING}
+    column = new_column()
+    append = column.append
+    for value in values:
+        result = converted.get(value)
+        if result is None:
+            result = convert(value)
+            if result is None:
+                result = MISSING
+            converted[value] = result
+        append(result)
+    return to_vector(column, numpy)
+
+
+def ja_nums_to_ints(
+    nums: Iterable[Optional[Union[int, str]]], use_numpy: Optional[bool] = None
+) -> Any:
+    """Convert Japanese numerical expressions to integers in bulk.
+
+    This is the same as ``ja_num_to_int`` applied to each of ``nums``, except that
+    each distinct expression is converted once.
+
+    Parameters
+    ----------
+    nums : iterable of int, str or None
+        Japanese numerical expressions, such as the values of a named group of
+        matches, where None is a missing value.
+    use_numpy : bool, optional
+        Whether to return a NumPy array instead of ``array.array`` (the default is to
+        do so if NumPy is installed). If True, NumPy must be installed.
+
+    Returns
+    -------
+    array.array or numpy.ndarray
+        The integers, where ``jatime.arrays.MISSING`` means a missing value or one
+        that cannot be converted.
+
+    Examples
+    --------
+    >>> list(ja_nums_to_ints(["十二", "１２", None, "あ", "十二"], use_numpy=False))
+    [12, 12, -1, -1, 12]
+    """
+    return _convert_all(nums, ja_num_to_int, use_numpy)
+
+
+def jp_years_to_ad_years(
+    jp_years: Iterable[Optional[str]], use_numpy: Optional[bool] = None
+) -> Any:
+    """Convert Japanese years to the Western calendar in bulk.
+
+    This is the same as ``jp_year_to_ad_year`` applied to each of ``jp_years``,
+    except that each distinct year is converted once.
+
+    Parameters
+    ----------
+    jp_years : iterable of str or None
+        Japanese years, where None is a missing value.
+    use_numpy : bool, optional
+        See ``ja_nums_to_ints``.
+
+    Returns
+    -------
+    array.array or numpy.ndarray
+        The Western years, where ``jatime.arrays.MISSING`` means a missing value or
+        one that cannot be converted.
+
+    Examples
+    --------
+    >>> list(jp_years_to_ad_years(["令和元", None, "昭和65"], use_numpy=False))
+    [2019, -1, -1]
+    """
+    return _convert_all(jp_years, jp_year_to_ad_year, use_numpy)
+
+
+def _hour_to_24_hour(ampm_hour: Tuple[Optional[str], Any]) -> Optional[int]:
+    ampm, hour = ampm_hour
+    hour = ja_num_to_int(hour)
+    if hour is None or ampm is None:
+        return hour
+    return ja_hour_to_24_hour(ampm, hour)
+
+
+def ja_hours_to_24_hours(
+    ampms: Iterable[Optional[str]],
+    hours: Iterable[Optional[Union[int, str]]],
+    use_numpy: Optional[bool] = None,
+) -> Any:
+    """Unify the expressions of hour with 24-hour clock in bulk.
+
+    Each hour is converted with ``ja_num_to_int`` and then, if its ``ampm`` is not
+    None, with ``ja_hour_to_24_hour``. Each distinct pair is converted once.
+
+    Parameters
+    ----------
+    ampms : iterable of str or None
+        Strings representing AM or PM, where None means neither.
+    hours : iterable of int, str or None
+        Japanese numerical expressions of the hour, where None is a missing value.
+    use_numpy : bool, optional
+        See ``ja_nums_to_ints``.
+
+    Returns
+    -------
+    array.array or numpy.ndarray
+        The 24-hour, where ``jatime.arrays.MISSING`` means a missing value or one
+        that cannot be converted.
+
+    Examples
+    --------
+    >>> list(ja_hours_to_24_hours(["午後", None, "午前"], ["三", "9", None], False))
+    [15, 9, -1]
+    """
+    return _convert_all(zip(ampms, hours), _hour_to_24_hour, use_numpy)
@@ -3,7 +3,7 @@ import json
 import click
 
 from jatime import __version__
-from jatime.analyzer import analyze
+from jatime.analyzer import analyze, analyze_many, analyze_parallel
 from jatime.server import app
 
 
@@ -24,6 +24,39 @@ def _analyze(format_json: bool, string: str) -> None:
         click.echo(result)
 
 
+@cli.command(
+    name="analyze-lines",
+    help="Analyze Japanese time expressions from each line of the file.",
+)
+@click.option("--format-json", is_flag=True, help="Output in json lines format.")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes.",
+)
+@click.option(
+    "--chunksize",
+    type=click.IntRange(min=1),
+    default=64,
+    show_default=True,
+    help="Number of lines sent to a worker process at a time.",
+)
+@click.argument("file", type=click.File(encoding="utf-8"))
+def _analyze_lines(format_json: bool, workers: int, chunksize: int, file) -> None:
+    lines = (line.rstrip("\n") for line in file)
+    if workers == 1:
+        results = analyze_many(lines)
+    else:
+        results = analyze_parallel(lines, workers=workers, chunksize=chunksize)
+    for result in results:
+        if format_json:
+            click.echo(json.dumps(result, ensure_ascii=False))
+        else:
+            click.echo(result)
+
+
 @cli.command(help="Start an HTTP server.")
 @click.option("--host", default="localhost", show_default=True)
 @click.option("--port", type=int, default=1729, show_default=True)
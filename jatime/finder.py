@@ -1,8 +1,17 @@
 import datetime
-from typing import Generator, Optional, Tuple
+import functools
+from bisect import bisect_left, bisect_right
+from typing import Generator, List, Optional, Tuple
 
 from jatime.errors import NotFoundError
 
+# グレゴリオ暦の周期（年）。400 年はちょうど 20871 週
+CYCLE = 400
+
+# 基準から探索する範囲（_years_close_to などの既定値に対応）
+_MAX_AFTER = 50
+_MAX_BEFORE = 49
+
 
 def _years_close_to(
     base_year: int, max_diff: Optional[int] = None
@@ -65,6 +74,63 @@ def year_from_month_day_dow(
     if base_year is None:
         base_year = datetime.date.today().year
 
+    if (
+        datetime.MINYEAR <= base_year - _MAX_BEFORE
+        and base_year + _MAX_AFTER <= datetime.MAXYEAR
+    ):
+        year = _closest_year(month, day, dow, base_year)
+    else:
+        # Some candidates are out of the range of datetime.date.
+        year = _search_year(month, day, dow, base_year)
+    if year is None:
+        raise NotFoundError(
+            f"could not find the year: ({month}, {day}, {dow}; {base_year})"
+        )
+    return year
+
+
+def _closest_offset(residues: List[int], r: int, cycle: int) -> Optional[int]:
+    # The offset from r to the closest of the sorted residues modulo cycle, in the
+    # order of 0, +1, -1, +2, -2, ... within the range of the search.
+    i = bisect_left(residues, r)
+    after = (residues[i] if i < len(residues) else residues[0] + cycle) - r
+    i = bisect_right(residues, r) - 1
+    before = r - (residues[i] if i >= 0 else residues[-1] - cycle)
+
+    if after <= _MAX_AFTER and (after <= before or _MAX_BEFORE < before):
+        return after
+    if before <= _MAX_BEFORE:
+        return -before
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _years_in_cycle(month: int, day: int) -> Tuple[List[int], ...]:
+    # The years in a cycle, as residues modulo CYCLE, in which the month and day fall
+    # on each day of the week. Years divisible by CYCLE are leap years like 2000.
+    years: Tuple[List[int], ...] = tuple([] for _ in range(7))
+    for r in range(CYCLE):
+        try:
+            years[datetime.date(2000 + r, month, day).weekday()].append(r)
+        except ValueError:
+            # February 29th of a non-leap year, or a date that does not exist.
+            continue
+    return years
+
+
+def _closest_year(month: int, day: int, dow: int, base_year: int) -> Optional[int]:
+    # Same as _search_year, given that every candidate is a valid year.
+    if not (0 <= dow < 7) or not (1 <= month <= 12) or not (1 <= day <= 31):
+        return None
+    residues = _years_in_cycle(month, day)[dow]
+    if not residues:
+        return None
+
+    offset = _closest_offset(residues, base_year % CYCLE, CYCLE)
+    return None if offset is None else base_year + offset
+
+
+def _search_year(month: int, day: int, dow: int, base_year: int) -> Optional[int]:
     for year in _years_close_to(base_year):
         # MEMO: It is always found within +-40 from the base year.
         try:
@@ -74,10 +140,7 @@ def year_from_month_day_dow(
         except ValueError:
             # February 29th of a non-leap year.
             continue
-
-    raise NotFoundError(
-        f"could not find the year: ({month}, {day}, {dow}; {base_year})"
-    )
+    return None
 
 
 def _years_months_close_to(
@@ -153,6 +216,56 @@ def year_month_from_day_dow(
     if base_month is None:
         base_month = datetime.date.today().month
 
+    # Months are numbered from January of year 0.
+    base = base_year * 12 + base_month - 1
+    if (
+        datetime.MINYEAR <= (base - _MAX_BEFORE) // 12
+        and (base + _MAX_AFTER) // 12 <= datetime.MAXYEAR
+    ):
+        year_month = _closest_year_month(day, dow, base)
+    else:
+        # Some candidates are out of the range of datetime.date.
+        year_month = _search_year_month(day, dow, base_year, base_month)
+    if year_month is None:
+        raise NotFoundError(
+            "could not find the year and month: "
+            f"({day}, {dow}; {base_year}, {base_month})"
+        )
+    return year_month
+
+
+@functools.lru_cache(maxsize=None)
+def _months_in_cycle(day: int) -> Tuple[List[int], ...]:
+    # The months in a cycle, as residues modulo 12 * CYCLE, in which the day falls on
+    # each day of the week.
+    months: Tuple[List[int], ...] = tuple([] for _ in range(7))
+    for r in range(12 * CYCLE):
+        try:
+            months[datetime.date(2000 + r // 12, r % 12 + 1, day).weekday()].append(r)
+        except ValueError:
+            # The day does not exist in the month.
+            continue
+    return months
+
+
+def _closest_year_month(day: int, dow: int, base: int) -> Optional[Tuple[int, int]]:
+    # Same as _search_year_month, given that every candidate is a valid month.
+    if not (0 <= dow < 7) or not (1 <= day <= 31):
+        return None
+    residues = _months_in_cycle(day)[dow]
+    if not residues:
+        return None
+
+    offset = _closest_offset(residues, base % (12 * CYCLE), 12 * CYCLE)
+    if offset is None:
+        return None
+    year, month = divmod(base + offset, 12)
+    return year, month + 1
+
+
+def _search_year_month(
+    day: int, dow: int, base_year: int, base_month: int
+) -> Optional[Tuple[int, int]]:
     for year, month in _years_months_close_to(base_year, base_month):
         # MEMO: It is always found within +-20 from the base year and base month.
         try:
@@ -161,7 +274,4 @@ def year_month_from_day_dow(
         except ValueError:
             # February 29th of a non-leap year.
             continue
-
-    raise NotFoundError(
-        f"could not find the year and month: ({day}, {dow}; {base_year}, {base_month})"
-    )
+    return None
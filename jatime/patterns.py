@@ -1,6 +1,26 @@
+import functools
 import itertools
 import re
-from typing import Generator
+import sys
+import threading
+from types import MappingProxyType
+from typing import (
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+)
+
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_parse as _sre_parse
 
 # 括弧
 _OPEN = r"[(（「『【〔［]"
@@ -125,6 +145,9 @@ _TIME = [
 TIME = [r"\s*".join(t) for t in _TIME]
 
 
+# 日付表現の構成要素をつなぐ区切り
+_GLUE = r"\s*の?\s*"
+
 # 優先順位付けられた日付表現のリスト
 _ORDERED_PATTERNS = [
     (YEAR, MONTH, DAY, DOW, TIME),
@@ -148,7 +171,426 @@ _ORDERED_PATTERNS = [
 ]
 
 
+# 正規表現中の文字カテゴリ
+_CATEGORIES = {
+    _sre_parse.CATEGORY_DIGIT: r"\d",
+    _sre_parse.CATEGORY_SPACE: r"\s",
+}
+
+
+def _collect_characters(parsed, characters: Set[str], categories: Set[str]) -> None:
+    for op, av in parsed:
+        if op == _sre_parse.LITERAL:
+            characters.add(chr(av))
+        elif op == _sre_parse.RANGE:
+            characters.update(chr(c) for c in range(av[0], av[1] + 1))
+        elif op == _sre_parse.CATEGORY:
+            categories.add(_CATEGORIES[av])
+        elif op == _sre_parse.IN:
+            _collect_characters(av, characters, categories)
+        elif op == _sre_parse.BRANCH:
+            for branch in av[1]:
+                _collect_characters(branch, characters, categories)
+        elif op in (_sre_parse.SUBPATTERN, _sre_parse.MAX_REPEAT):
+            _collect_characters(av[-1], characters, categories)
+        else:
+            raise ValueError(f"unsupported regular expression: {op}")
+
+
+def _class_requirements(av) -> FrozenSet[FrozenSet[str]]:
+    # A character class requires one of its characters, unless it has a category
+    # such as \d, whose characters are too many to list.
+    characters: Set[str] = set()
+    categories: Set[str] = set()
+    _collect_characters(av, characters, categories)
+    if categories:
+        return frozenset()
+    return frozenset([frozenset(characters)])
+
+
+def _branch_requirements(av) -> FrozenSet[FrozenSet[str]]:
+    # The clauses common to all the branches are required, and so is one of the
+    # characters required by each branch, if every branch requires some.
+    branches = [_requirements(branch) for branch in av[1]]
+    if not all(branches):
+        return frozenset()
+    return frozenset.intersection(*branches) | {
+        frozenset().union(
+            *(min(b, key=lambda c: (len(c), sorted(c))) for b in branches)
+        )
+    }
+
+
+def _requirements(parsed) -> FrozenSet[FrozenSet[str]]:
+    # Each clause is a set of characters, at least one of which appears in any
+    # string that the pattern matches.
+    clauses: Set[FrozenSet[str]] = set()
+    for op, av in parsed:
+        if op == _sre_parse.LITERAL:
+            clauses.add(frozenset(chr(av)))
+        elif op == _sre_parse.IN:
+            clauses.update(_class_requirements(av))
+        elif op == _sre_parse.BRANCH:
+            clauses.update(_branch_requirements(av))
+        elif op == _sre_parse.SUBPATTERN:
+            clauses.update(_requirements(av[-1]))
+        elif op == _sre_parse.MAX_REPEAT and av[0] > 0:
+            clauses.update(_requirements(av[-1]))
+    return frozenset(clauses)
+
+
+def _max_width(parsed) -> int:
+    # Unbounded repeats, i.e. whitespace between the parts, are counted once.
+    width = 0
+    for op, av in parsed:
+        if op in (_sre_parse.LITERAL, _sre_parse.IN):
+            width += 1
+        elif op == _sre_parse.BRANCH:
+            width += max(_max_width(branch) for branch in av[1])
+        elif op == _sre_parse.SUBPATTERN:
+            width += _max_width(av[-1])
+        elif op == _sre_parse.MAX_REPEAT:
+            count = 1 if av[1] == _sre_parse.MAXREPEAT else av[1]
+            width += count * _max_width(av[-1])
+        else:
+            raise ValueError(f"unsupported regular expression: {op}")
+    return width
+
+
+def _character_class() -> str:
+    characters: Set[str] = set()
+    categories: Set[str] = set()
+    for parsed in _PARSED_COMPONENTS + (_PARSED_GLUE,):
+        _collect_characters(parsed, characters, categories)
+    return (
+        "["
+        + "".join(sorted(categories))
+        + "".join(re.escape(c) for c in sorted(characters))
+        + "]"
+    )
+
+
+# 日付表現の構成要素（年・月・日・曜日・時刻の各表記）
+COMPONENTS = YEAR + MONTH + DAY + DOW + TIME
+
+# 構文解析した構成要素と区切り（幅や文字の計算に使い回す）
+_PARSED_COMPONENTS = tuple(_sre_parse.parse(c) for c in COMPONENTS)
+_PARSED_GLUE = _sre_parse.parse(_GLUE)
+
+# 構成要素ごとの最小の長さ
+COMPONENT_MIN_WIDTHS = tuple(parsed.getwidth()[0] for parsed in _PARSED_COMPONENTS)
+
+# 構成要素ごとの最大の長さ（空白はそれぞれ 1 文字までとする）
+COMPONENT_MAX_WIDTHS = tuple(_max_width(parsed) for parsed in _PARSED_COMPONENTS)
+
+# 構成要素をつなぐ区切りの最大の長さ（空白はそれぞれ 1 文字までとする）
+GLUE_MAX_WIDTH = _max_width(_PARSED_GLUE)
+
+# 構成要素ごとに必須の文字（各集合のいずれかの文字を必ず含む）
+COMPONENT_REQUIREMENTS = tuple(_requirements(parsed) for parsed in _PARSED_COMPONENTS)
+
+# いずれかの構成要素に必須の文字
+_ANCHORS = frozenset().union(*(c for cs in COMPONENT_REQUIREMENTS for c in cs))
+
+# 日付表現に含まれうる文字の文字クラス
+CHARACTER_CLASS = _character_class()
+
+# 日付表現の最小の長さ
+MIN_WIDTH = min(
+    sum(
+        min(COMPONENT_MIN_WIDTHS[COMPONENTS.index(c)] for c in family)
+        for family in time_repr
+    )
+    for time_repr in _ORDERED_PATTERNS
+)
+
+# 日付表現の最大の長さ（区切りの空白はそれぞれ 1 文字までとする）
+MAX_WIDTH = max(
+    sum(
+        max(COMPONENT_MAX_WIDTHS[COMPONENTS.index(c)] for c in family)
+        for family in time_repr
+    )
+    + GLUE_MAX_WIDTH * (len(time_repr) - 1)
+    for time_repr in _ORDERED_PATTERNS
+)
+
+
+class _Registry(NamedTuple):
+    # 優先順位順のパターン
+    patterns: Tuple[Pattern, ...]
+    # 各パターンを構成する要素の番号（COMPONENTS の添字）
+    components: Tuple[Tuple[int, ...], ...]
+    # 各構成要素の出現位置をすべて見つけるための先読みパターン
+    component_lookaheads: Tuple[Pattern, ...]
+    # 各パターンに必須の文字
+    requirements: Tuple[FrozenSet[FrozenSet[str]], ...]
+    # 各構成要素とそれに続く区切りのパターン
+    component_links: Tuple[Pattern, ...]
+    # 各構成要素のあとに続きうる構成要素
+    component_followers: Tuple[FrozenSet[int], ...]
+    # パターンの構成要素の末尾の並びと、その並びがパターン全体であればその番号
+    chains: Mapping[Tuple[int, ...], Optional[int]]
+
+
+# コンパイル済みパターンのレジストリ（初回アクセス時に一度だけ構築する）
+_registry: Optional[_Registry] = None
+_registry_lock = threading.Lock()
+
+
+def _build_registry() -> _Registry:
+    components = tuple(
+        tuple(COMPONENTS.index(c) for c in pattern_tuple)
+        for time_repr in _ORDERED_PATTERNS
+        for pattern_tuple in itertools.product(*time_repr)
+    )
+    return _Registry(
+        patterns=tuple(
+            re.compile(_GLUE.join(COMPONENTS[i] for i in c)) for c in components
+        ),
+        components=components,
+        component_lookaheads=tuple(re.compile(f"(?={c})") for c in COMPONENTS),
+        requirements=tuple(
+            frozenset().union(*(COMPONENT_REQUIREMENTS[i] for i in c))
+            for c in components
+        ),
+        component_links=tuple(re.compile(c + _GLUE) for c in COMPONENTS),
+        component_followers=_followers(components),
+        chains=MappingProxyType(_chains(components)),
+    )
+
+
+def _followers(components: Tuple[Tuple[int, ...], ...]) -> Tuple[FrozenSet[int], ...]:
+    followers: Tuple[Set[int], ...] = tuple(set() for _ in COMPONENTS)
+    for c in components:
+        for i, j in zip(c, c[1:]):
+            followers[i].add(j)
+    return tuple(frozenset(f) for f in followers)
+
+
+def _chains(
+    components: Tuple[Tuple[int, ...], ...],
+) -> Dict[Tuple[int, ...], Optional[int]]:
+    chains: Dict[Tuple[int, ...], Optional[int]] = {}
+    for c in components:
+        for i in range(1, len(c)):
+            chains.setdefault(c[i:], None)
+    for n, c in enumerate(components):
+        chains[c] = n
+    return chains
+
+
+def _get_registry() -> _Registry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = _build_registry()
+    return _registry
+
+
+def compiled_patterns() -> Tuple[Pattern, ...]:
+    """Return all datetime patterns compiled, in order of priority.
+
+    The patterns are compiled only once per process, on the first call, and the
+    same immutable tuple is returned afterwards. It is safe to call this function
+    from multiple threads.
+
+    Returns
+    -------
+    tuple of Pattern
+        Compiled patterns, the one with the highest priority first.
+    """
+    return _get_registry().patterns
+
+
+def pattern_components() -> Tuple[Tuple[int, ...], ...]:
+    """Return the components of each datetime pattern.
+
+    Returns
+    -------
+    tuple of tuple of int
+        For each pattern of ``compiled_patterns()``, the indices in ``COMPONENTS``
+        of the notations it is joined from.
+
+    Examples
+    --------
+    >>> [COMPONENTS[i] for i in pattern_components()[-1]] == [DOW[-1]]
+    True
+    """
+    return _get_registry().components
+
+
+def component_lookaheads() -> Tuple[Pattern, ...]:
+    """Return a lookahead pattern for each of ``COMPONENTS``.
+
+    The lookahead patterns match the empty string at every position where the
+    component can start, so that overlapping occurrences are found in one scan.
+    """
+    return _get_registry().component_lookaheads
+
+
+def component_links() -> Tuple[Pattern, ...]:
+    """Return a pattern for each of ``COMPONENTS`` followed by the glue.
+
+    A component can be followed by another in a datetime pattern only where the
+    text between their starts is matched entirely by this pattern.
+    """
+    return _get_registry().component_links
+
+
+def component_followers() -> Tuple[FrozenSet[int], ...]:
+    """Return the components that can follow each of ``COMPONENTS`` in a pattern.
+
+    Examples
+    --------
+    >>> COMPONENTS.index(DOW[0]) in component_followers()[COMPONENTS.index(DAY[0])]
+    True
+    >>> component_followers()[COMPONENTS.index(DOW[0])] == frozenset(
+    ...     COMPONENTS.index(t) for t in TIME
+    ... )
+    True
+    """
+    return _get_registry().component_followers
+
+
+def pattern_chains() -> Mapping[Tuple[int, ...], Optional[int]]:
+    """Return the chains of components that datetime patterns end with.
+
+    Returns
+    -------
+    mapping of tuple of int to int or None
+        For each trailing part of the components of a pattern, the index in
+        ``compiled_patterns()`` of the pattern made of exactly those components, or
+        None if there is no such pattern.
+
+    Examples
+    --------
+    >>> pattern_chains()[pattern_components()[-1]] == pattern_count() - 1
+    True
+    """
+    return _get_registry().chains
+
+
+def pattern_requirements() -> Tuple[FrozenSet[FrozenSet[str]], ...]:
+    """Return the characters required by each datetime pattern.
+
+    Returns
+    -------
+    tuple of frozenset of frozenset of str
+        For each pattern of ``compiled_patterns()``, sets of characters such that
+        any string matched by the pattern contains at least one character of each.
+
+    Examples
+    --------
+    The last pattern is a day of the week such as "土曜".
+
+    >>> sorted("".join(sorted(c)) for c in pattern_requirements()[-1])
+    ['土日月木水火金', '曜']
+    """
+    return _get_registry().requirements
+
+
+def possible_components(characters: Iterable[str]) -> FrozenSet[int]:
+    """Return the components that can occur in a string made of the characters.
+
+    Parameters
+    ----------
+    characters : iterable of str
+        The characters of a string, e.g. the string itself or ``set(string)``.
+
+    Returns
+    -------
+    frozenset of int
+        The indices in ``COMPONENTS`` whose required characters are all present.
+
+    Examples
+    --------
+    >>> possible_components("ありがとう")
+    frozenset()
+    >>> [COMPONENTS[i] for i in possible_components("土曜")] == [DOW[1]]
+    True
+    """
+    # Only the required characters matter, and few combinations of them occur in
+    # practice, so the result is cached by those characters.
+    return _possible_components(_ANCHORS.intersection(characters))
+
+
+@functools.lru_cache(maxsize=4096)
+def _possible_components(anchors: FrozenSet[str]) -> FrozenSet[int]:
+    return frozenset(
+        i
+        for i, clauses in enumerate(COMPONENT_REQUIREMENTS)
+        if all(not clause.isdisjoint(anchors) for clause in clauses)
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def patterns_of(components: FrozenSet[int]) -> Tuple[int, ...]:
+    """Return the patterns made only of the given components.
+
+    Parameters
+    ----------
+    components : frozenset of int
+        Indices in ``COMPONENTS``.
+
+    Returns
+    -------
+    tuple of int
+        Indices in ``compiled_patterns()``, in order of priority.
+    """
+    return tuple(
+        n for n, c in enumerate(pattern_components()) if components.issuperset(c)
+    )
+
+
+def possible_patterns(characters: Iterable[str]) -> Tuple[int, ...]:
+    """Return the patterns that can match a string made of the characters.
+
+    The required characters of a pattern are those of its components, so this is
+    the same as checking ``pattern_requirements()`` for every pattern.
+
+    Parameters
+    ----------
+    characters : iterable of str
+        The characters of a string, e.g. the string itself or ``set(string)``.
+
+    Returns
+    -------
+    tuple of int
+        Indices in ``compiled_patterns()``, in order of priority.
+    """
+    return patterns_of(possible_components(characters))
+
+
+def warmup() -> None:
+    """Compile all datetime patterns in advance.
+
+    Call this at startup (e.g. before forking workers or serving requests) so that
+    the first analysis does not pay for the compilation.
+    """
+    _get_registry()
+
+
+def pattern_count() -> int:
+    """Return the number of datetime patterns.
+
+    Examples
+    --------
+    >>> pattern_count() == len(compiled_patterns())
+    True
+    """
+    return len(compiled_patterns())
+
+
+def pattern_memory_size() -> int:
+    """Return the approximate memory size in bytes of the compiled patterns.
+
+    The size includes the compiled code of each pattern as reported by
+    ``sys.getsizeof``, as well as the tuple that holds them.
+    """
+    patterns = compiled_patterns() + component_lookaheads()
+    return sys.getsizeof(patterns) + sum(sys.getsizeof(p) for p in patterns)
+
+
 def datetime_patterns() -> Generator:
-    for time_repr in _ORDERED_PATTERNS:
-        for pattern_tuple in itertools.product(*time_repr):
-            yield re.compile(r"\s*の?\s*".join(pattern_tuple))
+    yield from compiled_patterns()
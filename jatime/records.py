@@ -0,0 +1,65 @@
+from typing import Dict, NamedTuple, Optional
+
+
+class TimeExpression(NamedTuple):
+    """A time expression found in a string.
+
+    This is an immutable tuple without a per-instance ``__dict__``, so it is much
+    smaller than the dict of ``analyze``. Use ``to_dict`` to get such a dict.
+    """
+
+    # Span of the time expression in the string
+    start: int
+    end: int
+    # Resolved values (see ``DateTime.ATTRS``)
+    year: Optional[int]
+    month: Optional[int]
+    day: Optional[int]
+    dow: Optional[int]
+    hour: Optional[int]
+    minute: Optional[int]
+    # Why the values are inconsistent, in which case they are all None
+    error: Optional[str] = None
+
+    def to_dict(self, string: Optional[str] = None) -> Dict:
+        """Return the time expression as a dict in the same form as ``analyze``.
+
+        Parameters
+        ----------
+        string : str, optional
+            The analyzed string. If given, the dict has the time expression as
+            ``string``; otherwise, it has ``start`` and ``end`` instead.
+
+        Returns
+        -------
+        dict
+            The values of the time expression, with ``error`` only if it is
+            inconsistent.
+
+        Examples
+        --------
+        >>> te = TimeExpression(3, 12, 2020, 10, 17, 5, None, None)
+        >>> te.to_dict("それは令和２年十月十七日の出来事でした。")["string"]
+        '令和２年十月十七日'
+        >>> te.to_dict()["start"], te.to_dict()["end"]
+        (3, 12)
+        """
+        if string is None:
+            dic = {"start": self.start, "end": self.end}
+        else:
+            dic = {"string": string[self.start : self.end]}
+        if self.error is None:
+            for key in ("year", "month", "day", "dow", "hour", "minute"):
+                dic[key] = getattr(self, key)
+        else:
+            dic["error"] = self.error
+        return dic
+
+
+class Extraction(NamedTuple):
+    """A time expression found by ``extract``, not yet resolved against a base time."""
+
+    # The time expression
+    string: str
+    # Named groups of the match (see ``jatime.patterns``)
+    groups: Dict[str, Optional[str]]
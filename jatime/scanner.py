@@ -0,0 +1,364 @@
+import functools
+import re
+import time
+from bisect import bisect_left, bisect_right
+from typing import (
+    AbstractSet,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from jatime.patterns import (
+    CHARACTER_CLASS,
+    COMPONENT_MAX_WIDTHS,
+    COMPONENT_MIN_WIDTHS,
+    GLUE_MAX_WIDTH,
+    MIN_WIDTH,
+    compiled_patterns,
+    component_followers,
+    component_links,
+    component_lookaheads,
+    pattern_chains,
+    possible_components,
+)
+from jatime.stats import pattern_recorder
+
+# 日付表現を含みうる文字の連続
+_RUN = re.compile(CHARACTER_CLASS + "+")
+
+# 未確定の区間 (start, end) または確定したマッチ
+_Piece = Union[Tuple[int, int], Match]
+
+# 空白文字
+_SPACE = re.compile(r"\s")
+
+# 構成要素の番号ごとの出現位置（昇順）
+_Lattice = Dict[int, List[int]]
+
+
+def _lattice(string: str, components: AbstractSet[int]) -> _Lattice:
+    lookaheads = component_lookaheads()
+    lattice: _Lattice = {}
+    for i in components:
+        starts = [m.start() for m in lookaheads[i].finditer(string)]
+        if starts:
+            lattice[i] = starts
+    return lattice
+
+
+def _split_range(
+    matches: Iterator[Match], start: int, end: int, keep_empty: bool
+) -> List[_Piece]:
+    pieces: List[_Piece] = []
+    i = start
+    for m in matches:
+        if keep_empty or i < m.start():
+            pieces.append((i, m.start()))
+        pieces.append(m)
+        i = m.end()
+    if i < end:
+        pieces.append((i, end))
+    return pieces
+
+
+def _split_run(
+    string: str, start: int, end: int, patterns: Sequence[Pattern]
+) -> List[_Piece]:
+    # `split` drops the empty pieces on the next pass, so only those left by the
+    # last pattern remain.
+    last = len(patterns) - 1
+    pieces: List[_Piece] = [(start, end)]
+    for n, pattern in enumerate(patterns):
+        new_pieces: List[_Piece] = []
+        for p in pieces:
+            if type(p) is tuple:
+                matches = pattern.finditer(string, p[0], p[1])
+                new_pieces.extend(_split_range(matches, p[0], p[1], n == last))
+            else:
+                new_pieces.append(p)
+        pieces = new_pieces
+    return pieces
+
+
+# 構成要素の並びの組
+_Chains = Tuple[Tuple[int, ...], ...]
+
+
+@functools.lru_cache(maxsize=4096)
+def _extend(c: int, tail: _Chains) -> _Chains:
+    # The chains made by putting component c before those of the tail.
+    chains = pattern_chains()
+    return tuple((c,) + t for t in tail if (c,) + t in chains)
+
+
+@functools.lru_cache(maxsize=4096)
+def _numbers(tail: _Chains) -> Tuple[int, ...]:
+    # The patterns made of exactly the components of one of the chains.
+    chains = pattern_chains()
+    return tuple(chains[t] for t in tail if chains.get(t) is not None)
+
+
+def _chains_from(
+    string: str,
+    occurrences: List[Tuple[int, int]],
+    positions: List[int],
+    spaces: List[int],
+    tails: List[_Chains],
+    k: int,
+) -> _Chains:
+    # The components of the chains that start at the k-th occurrence, given those
+    # that start at the later ones.
+    p, c = occurrences[k]
+    tail = ((c,),)
+    followers = component_followers()[c]
+    link = component_links()[c]
+    # Apart from whitespace, a component and the glue are only a few characters
+    # long.
+    limit = p + COMPONENT_MAX_WIDTHS[c] + GLUE_MAX_WIDTH
+    for j in range(
+        bisect_left(positions, p + COMPONENT_MIN_WIDTHS[c], k + 1), len(positions)
+    ):
+        q = positions[j]
+        if limit < q and limit + bisect_left(spaces, q) - bisect_left(spaces, p) < q:
+            break
+        if occurrences[j][1] in followers and link.fullmatch(string, p, q):
+            tail += _extend(c, tails[j])
+    # The same component may follow at several positions, e.g. after whitespace.
+    return tuple(dict.fromkeys(tail)) if len(tail) > 2 else tail
+
+
+def _candidates(string: str, lattice: _Lattice) -> Dict[int, List[int]]:
+    """Return the positions where each pattern can start, in ascending order. The
+    candidates of different patterns may overlap each other.
+
+    The occurrences of the components are chained from right to left, one following
+    another where the text between them is the component and the glue. Each chain
+    that makes up a pattern is a candidate, so the work grows with the occurrences
+    and chains in the string rather than with the number of patterns."""
+    followers = component_followers()
+    occurrences = sorted((p, c) for c, starts in lattice.items() for p in starts)
+    positions = [p for p, _ in occurrences]
+    spaces = [m.start() for m in _SPACE.finditer(string)]
+    # The components of the chains that start at each occurrence
+    tails: List[_Chains] = [()] * len(occurrences)
+    candidates: Dict[int, List[int]] = {}
+    for k in reversed(range(len(occurrences))):
+        p, c = occurrences[k]
+        if followers[c]:
+            tails[k] = _chains_from(string, occurrences, positions, spaces, tails, k)
+        else:
+            tails[k] = ((c,),)
+        for n in _numbers(tails[k]):
+            candidates.setdefault(n, []).append(p)
+    for starts in candidates.values():
+        starts.reverse()
+    return candidates
+
+
+# 文字の連続ごとの、まだマッチに使われていない区間の始点と終点
+_Gaps = List[Tuple[List[int], List[int]]]
+
+
+def _take(
+    gap_starts: List[int], gap_ends: List[int], i: int, start: int, end: int
+) -> None:
+    # Remove [start, end) from the i-th gap, keeping the parts left on either side.
+    # The later gaps of the same run are shifted.
+    parts = [(s, e) for s, e in ((gap_starts[i], start), (end, gap_ends[i])) if s < e]
+    gap_starts[i : i + 1] = [s for s, _ in parts]
+    gap_ends[i : i + 1] = [e for _, e in parts]
+
+
+def _match(
+    pattern: Pattern,
+    string: str,
+    start: int,
+    end: int,
+    record: Optional[Callable[[int, bool, float], None]],
+    n: int,
+) -> Optional[Match]:
+    # Match the n-th pattern, recording the result if pattern statistics are on.
+    if record is None:
+        return pattern.match(string, start, end)
+    t = time.perf_counter()
+    m = pattern.match(string, start, end)
+    record(n, m is not None, time.perf_counter() - t)
+    return m
+
+
+def _select(
+    string: str, runs: List[Tuple[int, int]], candidates: Dict[int, List[int]]
+) -> List[Tuple[Match, int]]:
+    """Select the matches that `split` would find, with their pattern numbers.
+
+    The candidates of each pattern are visited once, pattern by pattern in order of
+    priority, and those inside the matches of the patterns before are skipped by
+    bisection. No match contains a character outside the runs, so the ranges left
+    free are kept for each run, and taking a match only shifts those of its run. For
+    c candidates and r runs, this takes O(c log r) comparisons, plus O(m g) moves of
+    list items for m matches and g free ranges in a run, which is small unless a run
+    is very long."""
+    patterns = compiled_patterns()
+    record = pattern_recorder()
+    # The ranges of each run left free so far, between empty runs before and after
+    # all the others
+    run_starts = [-1] + [start for start, _ in runs] + [len(string)]
+    gaps: _Gaps = [([], [])] + [([start], [end]) for start, end in runs] + [([], [])]
+    selected: List[Tuple[Match, int]] = []
+    for n in sorted(candidates):
+        starts = candidates[n]
+        j = 0
+        while j < len(starts):
+            start = starts[j]
+            r = bisect_right(run_starts, start) - 1
+            gap_starts, gap_ends = gaps[r]
+            i = bisect_right(gap_starts, start) - 1
+            if i < 0 or gap_ends[i] <= start:
+                # Outside the runs or taken by a pattern of higher priority. Skip to
+                # the next free range of the run, or else to the next run.
+                if i + 1 < len(gap_starts):
+                    j = bisect_left(starts, gap_starts[i + 1], j + 1)
+                else:
+                    j = bisect_left(starts, run_starts[r + 1], j + 1)
+                continue
+
+            # Matching is deferred until here, so that it is done only at the
+            # candidates left, and within the gap as `split` does.
+            m = _match(patterns[n], string, start, gap_ends[i], record, n)
+            if m is None:
+                j += 1
+                continue
+
+            selected.append((m, n))
+            _take(gap_starts, gap_ends, i, start, m.end())
+            # The next match of the same pattern starts after this one.
+            j = bisect_left(starts, m.end(), j + 1)
+    selected.sort(key=lambda mn: mn[0].start())
+    return selected
+
+
+def _runs(string: str) -> List[Tuple[int, int]]:
+    # The runs of characters that are long enough to form a time expression
+    return [
+        (run.start(), run.end())
+        for run in _RUN.finditer(string)
+        if MIN_WIDTH <= run.end() - run.start()
+    ]
+
+
+def _pieces(string: str, patterns: Optional[Sequence[Pattern]]) -> Iterator[_Piece]:
+    if patterns is not None:
+        # Nothing is known about the characters that other patterns match.
+        yield from _split_run(string, 0, len(string), patterns)
+        return
+
+    # Skip the notations whose required characters are missing, and the whole
+    # string if there are none left.
+    components = possible_components(string)
+    if not components:
+        return
+    lattice = _lattice(string, components)
+    if not lattice:
+        return
+
+    last = len(compiled_patterns()) - 1
+    for m, n in _select(string, _runs(string), _candidates(string, lattice)):
+        if n == last:
+            # `split` keeps the gap before a match of the last pattern even if it
+            # is empty.
+            yield m.start(), m.start()
+        yield m
+
+
+def scan(
+    string: str, patterns: Optional[Sequence[Pattern]] = None
+) -> List[Union[str, Match]]:
+    """Split the string into time expressions and the rest in a single scan.
+
+    The result is the same as ``split(string, patterns)`` in ``jatime.analyzer``, but
+    matches are made on the original string, so no intermediate substrings are
+    created. With the default patterns, the string is scanned once from left to
+    right for runs of characters that can form a time expression, and the patterns
+    are applied only within those runs. Other patterns are applied to the whole
+    string, and are matched against it rather than against the pieces, so anchors
+    and lookarounds may see the characters around a piece.
+
+    With the default patterns, each notation in ``COMPONENTS`` is searched only
+    once for the whole string, and adjacent occurrences of the notations are
+    chained into candidates for the patterns. A pattern is tried only where such a
+    chain starts, so the cost grows with the notations found in the string rather
+    than with the number of their combinations. The candidates of all the patterns
+    are gathered first, and the matches are then selected from them in order of
+    priority, without splitting the string.
+
+    Parameters
+    ----------
+    string : str
+        The string to be scanned.
+    patterns : sequence of Pattern, optional
+        Patterns in order of priority (the default is all datetime patterns).
+
+    Returns
+    -------
+    list of str or Match
+        Pieces of the string, where time expressions are Match objects.
+
+    Examples
+    --------
+    >>> [p if type(p) == str else p.group() for p in scan("昨日は十月十七日でした。")]
+    ['昨日', 'は', '十月十七日', 'でした。']
+    """
+    result: List[Union[str, Match]] = []
+    gap_start = 0
+    # An empty gap left by the last pattern is kept, as `split` does.
+    kept = False
+    for p in _pieces(string, patterns):
+        if type(p) is tuple:
+            kept = True
+            continue
+        if gap_start < p.start() or kept:
+            result.append(string[gap_start : p.start()])
+        result.append(p)
+        gap_start = p.end()
+        kept = False
+    if gap_start < len(string):
+        result.append(string[gap_start:])
+    return result
+
+
+def finditer(
+    string: str, patterns: Optional[Sequence[Pattern]] = None
+) -> Iterator[Match]:
+    """Return an iterator over the time expressions in the string.
+
+    The matches are the same as those of ``scan``, but the rest of the string is not
+    sliced.
+
+    Parameters
+    ----------
+    string : str
+        The string to be scanned.
+    patterns : sequence of Pattern, optional
+        Patterns in order of priority (the default is all datetime patterns).
+
+    Yields
+    ------
+    Match
+        Time expressions, from left to right.
+
+    Examples
+    --------
+    >>> [m.group() for m in finditer("昨日は十月十七日でした。")]
+    ['昨日', '十月十七日']
+    """
+    for p in _pieces(string, patterns):
+        if type(p) is not tuple:
+            yield p
@@ -0,0 +1,191 @@
+import threading
+from typing import Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional
+
+from jatime.patterns import COMPONENTS, compiled_patterns
+
+# 順序を更新するまでの記録回数
+_REORDER_INTERVAL = 256
+
+
+class PatternStats(NamedTuple):
+    # Index in ``compiled_patterns()`` or in ``COMPONENTS``
+    index: int
+    # Number of times it was tried and found a match
+    attempts: int
+    hits: int
+    # Total time spent trying it
+    seconds: float
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.attempts if self.attempts else 0.0
+
+
+class _Counters(object):
+    def __init__(self) -> None:
+        # index -> [attempts, hits, seconds]
+        self.counts: Dict[int, List] = {}
+        self.records = 0
+
+    def record(self, index: int, hit: bool, seconds: float) -> None:
+        with _lock:
+            counts = self.counts.get(index)
+            if counts is None:
+                counts = self.counts[index] = [0, 0, 0.0]
+            counts[0] += 1
+            counts[1] += hit
+            counts[2] += seconds
+            self.records += 1
+
+    def stats(self) -> List[PatternStats]:
+        with _lock:
+            stats = [PatternStats(i, *counts) for i, counts in self.counts.items()]
+        return sorted(stats, key=lambda s: (-s.hits, s.index))
+
+
+_lock = threading.Lock()
+_patterns: Optional[_Counters] = None
+_components: Optional[_Counters] = None
+
+# 観測されたヒット率による構成要素の順位（適応的な順序付けが無効なら None）
+_ranks: Optional[Dict[int, float]] = None
+_ranked_at = 0
+
+
+def enable_stats() -> None:
+    """Start recording how often and how long each pattern is tried.
+
+    Recording is off by default. While it is on, ``jatime.scanner`` records each
+    attempt to match a pattern, and ``contains_time_expression`` each search for a
+    component. Use ``pattern_stats``, ``component_stats`` or ``report`` to see them.
+    """
+    global _patterns, _components
+    with _lock:
+        if _patterns is None:
+            _patterns = _Counters()
+            _components = _Counters()
+
+
+def disable_stats() -> None:
+    """Stop recording, discard the statistics and disable adaptive ordering."""
+    global _patterns, _components, _ranks
+    with _lock:
+        _patterns = _components = None
+        _ranks = None
+
+
+def pattern_recorder() -> Optional[Callable[[int, bool, float], None]]:
+    """Return the function recording an attempt to match a pattern, or None if
+    recording is off."""
+    counters = _patterns
+    return None if counters is None else counters.record
+
+
+def component_recorder() -> Optional[Callable[[int, bool, float], None]]:
+    """Return the function recording a search for a component, or None if recording
+    is off."""
+    counters = _components
+    return None if counters is None else counters.record
+
+
+def pattern_stats() -> List[PatternStats]:
+    """Return the statistics of the patterns tried, the most hit first.
+
+    Examples
+    --------
+    >>> from jatime.scanner import scan
+    >>> enable_stats()
+    >>> _ = scan("昨日は十月十七日でした。")
+    >>> sum(s.hits for s in pattern_stats())
+    2
+    >>> disable_stats()
+    """
+    counters = _patterns
+    return [] if counters is None else counters.stats()
+
+
+def component_stats() -> List[PatternStats]:
+    """Return the statistics of the components searched, the most hit first."""
+    counters = _components
+    return [] if counters is None else counters.stats()
+
+
+def report() -> Dict[str, List[Dict]]:
+    """Return the statistics in a form that can be dumped as JSON.
+
+    Returns
+    -------
+    dict
+        ``patterns`` and ``components``, each a list of dicts with ``index``,
+        ``regex``, ``attempts``, ``hits``, ``hit_rate`` and ``seconds``.
+    """
+
+    def rows(stats: List[PatternStats], regexes: List[str]) -> List[Dict]:
+        return [
+            {
+                "index": s.index,
+                "regex": regexes[s.index],
+                "attempts": s.attempts,
+                "hits": s.hits,
+                "hit_rate": s.hit_rate,
+                "seconds": s.seconds,
+            }
+            for s in stats
+        ]
+
+    patterns = [p.pattern for p in compiled_patterns()]
+    return {
+        "patterns": rows(pattern_stats(), patterns),
+        "components": rows(component_stats(), COMPONENTS),
+    }
+
+
+def enable_adaptive_order() -> None:
+    """Search components with higher observed hit rates first where the order does
+    not matter.
+
+    This also enables recording. It only affects ``contains_time_expression``, which
+    returns whether any of a set of components is found. The result of such a check
+    is the same in any order, so only the time to the first hit changes. The priority
+    of the patterns, which decides the matches of ``scan`` and ``analyze``, is never
+    reordered.
+    """
+    global _ranks, _ranked_at
+    enable_stats()
+    with _lock:
+        if _ranks is None:
+            _ranks = {}
+            _ranked_at = 0
+
+
+def disable_adaptive_order() -> None:
+    """Search components in their fixed order again. Recording is left as it is."""
+    global _ranks
+    with _lock:
+        _ranks = None
+
+
+def ordered_components(components: FrozenSet[int]) -> Iterable[int]:
+    """Return the components in the order in which to search for any of them.
+
+    The order is by observed hit rate if adaptive ordering is enabled, and arbitrary
+    otherwise. The set is only reordered, so this must be used only where the order
+    does not change the result.
+    """
+    ranks = _ranks
+    if ranks is None:
+        return components
+    counters = _components
+    if counters is not None and _REORDER_INTERVAL <= counters.records - _ranked_at:
+        ranks = _rerank(counters)
+    return sorted(components, key=lambda i: (-ranks.get(i, 0.0), i))
+
+
+def _rerank(counters: _Counters) -> Dict[int, float]:
+    global _ranks, _ranked_at
+    ranks = {s.index: s.hit_rate for s in counters.stats()}
+    with _lock:
+        if _ranks is not None:
+            _ranks = ranks
+            _ranked_at = counters.records
+    return ranks
@@ -0,0 +1,243 @@
+import codecs
+import datetime
+import mmap as _mmap
+import os
+import re
+from typing import Dict, Iterable, Iterator, List, Match, Optional, TextIO, Tuple, Union
+
+from jatime.analyzer import _resolve
+from jatime.patterns import CHARACTER_CLASS, MAX_WIDTH, warmup
+from jatime.scanner import finditer
+
+# 日付表現に含まれえない文字
+_BOUNDARY = re.compile("[^" + CHARACTER_CLASS[1:])
+
+
+def _read_chunks(
+    source: Union[TextIO, Iterable[str]], chunk_size: int
+) -> Iterator[str]:
+    if not hasattr(source, "read"):
+        yield from source
+        return
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _last_boundary(chunk: str) -> int:
+    # The position just after the last character that cannot be part of a time
+    # expression, or 0 if there is none.
+    m = _BOUNDARY.search(chunk[::-1])
+    return 0 if m is None else len(chunk) - m.start()
+
+
+def _commit(string: str, end: int) -> Tuple[int, List[Match]]:
+    # Return the position up to which the string is done and the matches before it.
+    # A time expression crossing ``end`` is left for the next round.
+    matches = []
+    for m in finditer(string):
+        if end < m.end():
+            if m.start() == 0:
+                matches.append(m)
+                end = m.end()
+            elif m.start() < end:
+                end = m.start()
+            break
+        matches.append(m)
+    return end, matches
+
+
+def _segments(
+    chunks: Iterable[str], max_pending: int
+) -> Iterator[Tuple[str, int, List[Match]]]:
+    # Yield (segment, end, matches): the text of the stream is the concatenation of
+    # ``segment[:end]``, and ``matches`` are the time expressions in it.
+    pending = ""
+    for chunk in chunks:
+        cut = _last_boundary(chunk)
+        if cut > 0:
+            segment = pending + chunk[:cut]
+            pending = chunk[cut:]
+            yield segment, len(segment), list(finditer(segment))
+        else:
+            pending += chunk
+        if len(pending) <= max_pending:
+            continue
+
+        # No boundary for too long. Keep only the window that may hold a time
+        # expression crossing the end.
+        end, matches = _commit(pending, len(pending) - MAX_WIDTH)
+        yield pending, end, matches
+        pending = pending[end:]
+
+    if pending:
+        yield pending, len(pending), list(finditer(pending))
+
+
+def _check_arguments(chunk_size: int, max_pending: int) -> None:
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, but {chunk_size} was given.")
+    if max_pending <= MAX_WIDTH:
+        raise ValueError(
+            f"max_pending must be greater than {MAX_WIDTH}, "
+            f"but {max_pending} was given."
+        )
+
+
+def analyze_stream(
+    source: Union[TextIO, Iterable[str]],
+    base: Optional[datetime.datetime] = None,
+    chunk_size: int = 65536,
+    max_pending: int = 1048576,
+) -> Iterator[Union[str, Dict]]:
+    """Analyze a text of any size, reading it chunk by chunk.
+
+    The text is analyzed in segments that end with a character which cannot be part
+    of a time expression, so time expressions split across chunks are found as if
+    the whole text were analyzed at once. Only the text after the last such
+    character is carried over to the next chunk.
+
+    Parameters
+    ----------
+    source : file object or iterable of str
+        A text file opened for reading, or chunks of the text.
+    base : datetime.datetime, optional
+        The base time of the analysis (the default is the time of the call).
+    chunk_size : int, optional
+        The number of characters read from ``source`` at a time, if it is a file
+        (the default is 65536).
+    max_pending : int, optional
+        The maximum number of characters carried over to the next chunk (the
+        default is 1048576). Beyond this, only the last ``MAX_WIDTH`` characters
+        are carried over, so a time expression is found unless it crosses that
+        window, which requires an unusually long run of digits or whitespace.
+
+    Yields
+    ------
+    str or dict
+        The same pieces as ``analyze``, except that a piece of text may be yielded
+        in several parts and that empty pieces of text are omitted.
+
+    Examples
+    --------
+    >>> chunks = ["それは令和２年十", "月十七日の出来事でした。"]
+    >>> [p if type(p) == str else p["day"] for p in analyze_stream(chunks)]
+    ['それは', 17, 'の出来事でした。']
+    """
+    _check_arguments(chunk_size, max_pending)
+    if base is None:
+        base = datetime.datetime.now()
+    warmup()
+
+    return _analyze_stream(_read_chunks(source, chunk_size), base, max_pending)
+
+
+def _analyze_stream(
+    chunks: Iterator[str], base: datetime.datetime, max_pending: int
+) -> Iterator[Union[str, Dict]]:
+    for segment, end, matches in _segments(chunks, max_pending):
+        pos = 0
+        for m in matches:
+            if pos < m.start():
+                yield segment[pos : m.start()]
+            dic = {"string": m.group()}
+            dic.update(_resolve(m.groupdict(), base))
+            yield dic
+            pos = m.end()
+        if pos < end:
+            yield segment[pos:end]
+
+
+def _read_bytes(path: str, use_mmap: bool, chunk_size: int) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        if not use_mmap or os.fstat(f.fileno()).st_size == 0:
+            yield from iter(lambda: f.read(chunk_size), b"")
+            return
+        with _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ) as m:
+            # Python 3.8+: read ahead, and release the pages already decoded so
+            # that the resident memory does not grow with the file.
+            advise = hasattr(_mmap, "MADV_DONTNEED")
+            if advise:
+                m.madvise(_mmap.MADV_SEQUENTIAL)
+            released = 0
+            for i in range(0, len(m), chunk_size):
+                yield m[i : i + chunk_size]
+                end = min(i + chunk_size, len(m)) // _mmap.PAGESIZE * _mmap.PAGESIZE
+                if advise and released < end:
+                    m.madvise(_mmap.MADV_DONTNEED, released, end - released)
+                    released = end
+
+
+def _decode(chunks: Iterator[bytes]) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+def _utf8_length(string: str, start: int, end: int) -> int:
+    return len(string[start:end].encode("utf-8"))
+
+
+def analyze_file(
+    path: str,
+    base: Optional[datetime.datetime] = None,
+    mmap: bool = True,
+    chunk_size: int = 1048576,
+    max_pending: int = 1048576,
+) -> Iterator[Dict]:
+    """Analyze a UTF-8 text file of any size.
+
+    The file is memory-mapped and decoded chunk by chunk, so neither the file nor
+    the text around the time expressions is held in memory as a whole. Time
+    expressions are found in the same way as ``analyze_stream``.
+
+    Parameters
+    ----------
+    path : str
+        The path of a UTF-8 text file.
+    base : datetime.datetime, optional
+        The base time of the analysis (the default is the time of the call).
+    mmap : bool, optional
+        Whether to memory-map the file (the default is True). If False, the file is
+        read with ordinary buffered reads.
+    chunk_size : int, optional
+        The number of bytes decoded at a time (the default is 1048576).
+    max_pending : int, optional
+        See ``analyze_stream``.
+
+    Yields
+    ------
+    dict
+        Each time expression with its byte offsets in the file as ``start`` and
+        ``end``, followed by the same items as in ``analyze`` except ``string``.
+    """
+    _check_arguments(chunk_size, max_pending)
+    if base is None:
+        base = datetime.datetime.now()
+    warmup()
+
+    return _analyze_file(path, base, mmap, chunk_size, max_pending)
+
+
+def _analyze_file(
+    path: str,
+    base: datetime.datetime,
+    use_mmap: bool,
+    chunk_size: int,
+    max_pending: int,
+) -> Iterator[Dict]:
+    chunks = _decode(_read_bytes(path, use_mmap, chunk_size))
+    offset = 0
+    for segment, end, matches in _segments(chunks, max_pending):
+        pos = 0
+        for m in matches:
+            start = offset + _utf8_length(segment, pos, m.start())
+            offset = start + _utf8_length(segment, m.start(), m.end())
+            dic = {"start": start, "end": offset}
+            dic.update(_resolve(m.groupdict(), base))
+            yield dic
+            pos = m.end()
+        offset += _utf8_length(segment, pos, end)
@@ -1,5 +1,5 @@
 import datetime
-from typing import Dict, Optional, Tuple
+from typing import Dict, Match, Optional, Tuple
 
 from jatime.converter import (
     ja_hour_to_24_hour,
@@ -17,39 +17,105 @@ class DateTime(object):
     ATTRS = ["year", "month", "day", "dow", "hour", "minute"]
     DOW = "月火水木金土日"
 
+    __slots__ = (
+        "base",
+        "_year",
+        "_month",
+        "day",
+        "dow",
+        "hour",
+        "minute",
+        "_estimated",
+    )
+
     def __init__(self, base: Optional[datetime.datetime] = None, **kwargs) -> None:
         self.base = datetime.datetime.now() if base is None else base
-
-        self.year = self._given_year(**kwargs)
-        self.month = self._given_month(**kwargs)
-        self.day = self._given_day(**kwargs)
-        self.dow = self._given_dow(**kwargs)
-        self.hour = self._given_hour(**kwargs)
-        self.minute = self._given_minute(**kwargs)
-
-        self._estimate()
-
-    def _relative_year(self, **kwargs) -> Optional[int]:
-        if "relative_year" not in kwargs.keys():
-            return None
-
-        year = relative_year_into_absolute(kwargs["relative_year"], self.base.year)
-        if year is None:
+        self._resolve(kwargs)
+
+    @classmethod
+    def from_groups(
+        cls, groups: Dict[str, Optional[str]], base: Optional[datetime.datetime] = None
+    ) -> "DateTime":
+        """Create an instance from the named groups of a match.
+
+        This is the same as ``DateTime(base=base, **groups)`` except that the groups
+        are not copied, and that a group of None is the same as a missing one.
+        """
+        self = cls.__new__(cls)
+        self.base = datetime.datetime.now() if base is None else base
+        self._resolve(groups)
+        return self
+
+    @classmethod
+    def from_match(
+        cls, match: Match, base: Optional[datetime.datetime] = None
+    ) -> "DateTime":
+        """Create an instance from a match of a pattern in ``jatime.patterns``.
+
+        Examples
+        --------
+        >>> from jatime.scanner import finditer
+        >>> match = next(finditer("午後３時半"))
+        >>> dt = DateTime.from_match(match)
+        >>> dt.hour, dt.minute
+        (15, 30)
+        """
+        return cls.from_groups(match.groupdict(), base)
+
+    def _resolve(self, groups: Dict[str, Optional[str]]) -> None:
+        self._year = self._given_year(groups)
+        self._month = self._given_month(groups)
+        self.day = self._given_day(groups)
+        self.dow = self._given_dow(groups)
+        self.hour = self._given_hour(groups)
+        self.minute = self._given_minute(groups)
+
+        # The year and month are estimated on first access.
+        self._estimated = False
+
+    @property
+    def year(self) -> Optional[int]:
+        if not self._estimated:
+            self._estimate()
+        return self._year
+
+    @year.setter
+    def year(self, year: Optional[int]) -> None:
+        if not self._estimated:
+            self._estimate()
+        self._year = year
+
+    @property
+    def month(self) -> Optional[int]:
+        if not self._estimated:
+            self._estimate()
+        return self._month
+
+    @month.setter
+    def month(self, month: Optional[int]) -> None:
+        if not self._estimated:
+            self._estimate()
+        self._month = month
+
+    def _relative_year(self, groups: Dict[str, Optional[str]]) -> Optional[int]:
+        relative_year = groups.get("relative_year")
+        if relative_year is None:
             return None
 
-        return year
+        return relative_year_into_absolute(relative_year, self.base.year)
 
-    def _given_year(self, **kwargs) -> Optional[int]:
-        year = self._relative_year(**kwargs)
+    def _given_year(self, groups: Dict[str, Optional[str]]) -> Optional[int]:
+        year = self._relative_year(groups)
         if year is not None:
             return year
 
-        year_ad = ja_num_to_int(kwargs.get("ad_year", None))
+        year_ad = ja_num_to_int(groups.get("ad_year"))
 
-        if "jp_year" not in kwargs.keys():
+        jp_year = groups.get("jp_year")
+        if jp_year is None:
             return year_ad
 
-        year_jp = jp_year_to_ad_year(kwargs["jp_year"])
+        year_jp = jp_year_to_ad_year(jp_year)
         if year_jp is None:
             return year_ad
         elif year_ad is None:
@@ -58,29 +124,26 @@ class DateTime(object):
         if year_jp == year_ad:
             return year_jp
         else:
-            raise InvalidValueError(
-                f"{kwargs['jp_year']} is not {year_ad}, but {year_jp}."
-            )
+            raise InvalidValueError(f"{jp_year} is not {year_ad}, but {year_jp}.")
 
-    def _relative_month(self, **kwargs) -> Optional[Tuple[int, int]]:
-        if "relative_month" not in kwargs.keys():
+    def _relative_month(
+        self, groups: Dict[str, Optional[str]]
+    ) -> Optional[Tuple[int, int]]:
+        relative_month = groups.get("relative_month")
+        if relative_month is None:
             return None
 
-        year_month = relative_month_into_absolute(
-            kwargs["relative_month"], self.base.year, self.base.month
+        return relative_month_into_absolute(
+            relative_month, self.base.year, self.base.month
         )
-        if year_month is None:
-            return None
-
-        return year_month
 
-    def _given_month(self, **kwargs) -> Optional[int]:
-        year_month = self._relative_month(**kwargs)
+    def _given_month(self, groups: Dict[str, Optional[str]]) -> Optional[int]:
+        year_month = self._relative_month(groups)
         if year_month is not None:
-            self.year = year_month[0]
+            self._year = year_month[0]
             return year_month[1]
 
-        month = ja_num_to_int(kwargs.get("month", None))
+        month = ja_num_to_int(groups.get("month"))
         if month is None:
             return None
         if month < 1 or 12 < month:
@@ -88,44 +151,44 @@ class DateTime(object):
 
         return month
 
-    def _relative_day(self, **kwargs) -> Optional[Tuple[int, int, int]]:
-        if "relative_day" not in kwargs.keys():
+    def _relative_day(
+        self, groups: Dict[str, Optional[str]]
+    ) -> Optional[Tuple[int, int, int]]:
+        relative_day = groups.get("relative_day")
+        if relative_day is None:
             return None
 
-        year_month_day = relative_day_into_absolute(
-            kwargs["relative_day"], self.base.year, self.base.month, self.base.day
+        return relative_day_into_absolute(
+            relative_day, self.base.year, self.base.month, self.base.day
         )
-        if year_month_day is None:
-            return None
-
-        return year_month_day
 
-    def _given_day(self, **kwargs) -> Optional[int]:
-        year_month_day = self._relative_day(**kwargs)
+    def _given_day(self, groups: Dict[str, Optional[str]]) -> Optional[int]:
+        year_month_day = self._relative_day(groups)
         if year_month_day is not None:
-            self.year = year_month_day[0]
-            self.month = year_month_day[1]
+            self._year = year_month_day[0]
+            self._month = year_month_day[1]
             return year_month_day[2]
 
-        day = ja_num_to_int(kwargs.get("day", None))
+        day = ja_num_to_int(groups.get("day"))
         if day is None:
             return None
         if day < 1 or 31 < day:
             raise InvalidValueError(f"day must be in 1..31, but {day} was given.")
         return day
 
-    def _given_dow(self, **kwargs) -> Optional[int]:
-        if self.year is not None and self.month is not None and self.day is not None:
-            date = datetime.date(self.year, self.month, self.day)
+    def _given_dow(self, groups: Dict[str, Optional[str]]) -> Optional[int]:
+        if self._year is not None and self._month is not None and self.day is not None:
+            date = datetime.date(self._year, self._month, self.day)
             calculated_dow = date.weekday()
         else:
             date = None
             calculated_dow = None
 
-        if "dow" not in kwargs.keys():
+        given_dow = groups.get("dow")
+        if given_dow is None:
             return calculated_dow
 
-        dow = self.DOW.index(kwargs["dow"])
+        dow = self.DOW.index(given_dow)
         if calculated_dow is None or dow == calculated_dow:
             return dow
 
@@ -134,19 +197,20 @@ class DateTime(object):
         )
 
     @staticmethod
-    def _given_hour(**kwargs) -> Optional[int]:
-        hour = ja_num_to_int(kwargs.get("hour", None))
+    def _given_hour(groups: Dict[str, Optional[str]]) -> Optional[int]:
+        hour = ja_num_to_int(groups.get("hour"))
         if hour is None:
             return None
-        if "ampm" in kwargs.keys():
-            hour = ja_hour_to_24_hour(kwargs["ampm"], hour)
+        ampm = groups.get("ampm")
+        if ampm is not None:
+            hour = ja_hour_to_24_hour(ampm, hour)
         if hour < 0 or 29 < hour:
             raise InvalidValueError(f"hour must be in 0..29, but {hour} was given.")
         return hour
 
     @staticmethod
-    def _given_minute(**kwargs) -> Optional[int]:
-        minute = ja_num_to_int(kwargs.get("minute", None))
+    def _given_minute(groups: Dict[str, Optional[str]]) -> Optional[int]:
+        minute = ja_num_to_int(groups.get("minute"))
         if minute is None:
             return None
         if minute < 0 or 59 < minute:
@@ -155,24 +219,28 @@ class DateTime(object):
 
     def _estimate(self) -> None:
         if (
-            self.year is None
-            and self.month is not None
+            self._year is None
+            and self._month is not None
             and self.day is not None
             and self.dow is not None
         ):
-            self.year = year_from_month_day_dow(
-                self.month, self.day, self.dow, self.base.year
+            self._year = year_from_month_day_dow(
+                self._month, self.day, self.dow, self.base.year
             )
 
         if (
-            self.year is None
-            and self.month is None
+            self._year is None
+            and self._month is None
             and self.day is not None
             and self.dow is not None
         ):
-            self.year, self.month = year_month_from_day_dow(
+            self._year, self._month = year_month_from_day_dow(
                 self.day, self.dow, self.base.year, self.base.month
             )
+        self._estimated = True
 
     def to_dict(self) -> Dict:
         return {key: getattr(self, key) for key in self.ATTRS}
+
+    def to_tuple(self) -> Tuple[Optional[int], ...]:
+        return tuple(getattr(self, key) for key in self.ATTRS)
@@ -1,8 +1,23 @@
+import datetime
 import re
 
 import pytest
 
-from jatime.analyzer import _split, analyze, split
+from jatime.analyzer import (
+    _split,
+    analyze,
+    analyze_many,
+    analyze_parallel,
+    analyze_records,
+    analyze_spans,
+    clear_resolution_cache,
+    contains_time_expression,
+    count_time_expressions,
+    extract,
+    resolution_cache_info,
+    resolve,
+    split,
+)
 
 
 @pytest.mark.parametrize(
@@ -52,3 +67,122 @@ def test_analyze():
 def test_example():
     result = analyze("それは令和２年十月十七日の出来事でした。")
     print(result)
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "",
+        "ありがとうございました。",
+        "日本の未来",
+        "土曜",
+        "それは令和２年十月十七日の出来事でした。",
+        "あああ令和２年十月十七日あああ平成一九年(2007年)１０月１８日あああ",
+        "13月32日",
+        "午後３時半と15:30",
+    ],
+)
+def test_predicates_agree_with_analyze(string):
+    count = sum(1 for r in analyze(string) if type(r) == dict)
+    assert count_time_expressions(string) == count
+    assert contains_time_expression(string) == (count > 0)
+
+
+def test_analyze_many_is_the_same_as_analyze():
+    base = datetime.datetime(2020, 10, 17)
+    strings = ["それは令和２年十月十七日の出来事でした。", "", "昨日", "土曜", "あ"]
+    assert list(analyze_many(strings, base)) == [analyze(s, base) for s in strings]
+
+
+def test_analyze_many_is_lazy():
+    def strings():
+        yield "昨日"
+        raise RuntimeError("must not be consumed")
+
+    results = analyze_many(strings(), datetime.datetime(2020, 10, 17))
+    assert next(results)[0]["day"] == 16
+
+
+def test_analyze_parallel_keeps_the_order():
+    base = datetime.datetime(2020, 10, 17)
+    strings = ["それは令和２年十月十七日の出来事でした。", "", "昨日", "土曜", "あ"] * 7
+    results = analyze_parallel(iter(strings), workers=2, chunksize=3, base=base)
+    assert list(results) == [analyze(s, base) for s in strings]
+
+
+@pytest.mark.parametrize("kwargs", [{"workers": 0}, {"chunksize": 0}])
+def test_analyze_parallel_rejects_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        analyze_parallel(["あ"], **kwargs)
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "",
+        "あ",
+        "土曜",
+        "あああ令和２年十月十七日あああ平成一九年(2007年)１０月１８日あああ",
+        "2021年1月1日(月)と午後３時半",
+    ],
+)
+def test_analyze_spans_agree_with_analyze(string):
+    base = datetime.datetime(2020, 10, 17)
+    expected = []
+    offset = 0
+    for r in analyze(string, base):
+        if type(r) == str:
+            offset += len(r)
+            continue
+        start, offset = offset, offset + len(r["string"])
+        keys = ["year", "month", "day", "dow", "hour", "minute", "error"]
+        expected.append((start, offset) + tuple(r.get(key) for key in keys))
+    assert analyze_spans(string, base) == expected
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "",
+        "土曜",
+        "あああ令和２年十月十七日あああ平成一九年(2007年)１０月１８日あああ",
+        "2021年1月1日(月)と午後３時半",
+    ],
+)
+def test_analyze_records_agree_with_analyze(string):
+    base = datetime.datetime(2020, 10, 17)
+    records = analyze_records(string, base)
+    assert records == analyze_spans(string, base)
+    expected = [r for r in analyze(string, base) if type(r) != str]
+    assert [r.to_dict(string) for r in records] == expected
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "",
+        "あ",
+        "土曜",
+        "昨日と来月",
+        "あああ令和２年十月十七日あああ平成一九年(2007年)１０月１８日あああ",
+        "2月30日",
+    ],
+)
+@pytest.mark.parametrize(
+    "base", [datetime.datetime(2020, 10, 17), datetime.datetime(2021, 3, 1, 9, 30)]
+)
+def test_resolve_extraction_agrees_with_analyze(string, base):
+    assert resolve(extract(string), base) == analyze(string, base)
+
+
+def test_resolution_cache():
+    clear_resolution_cache()
+    base = datetime.datetime(2020, 10, 17, 9)
+    first = analyze("昨日と十月十七日(土)と2月30日", base)
+    assert resolution_cache_info().misses == 3
+    assert analyze("2月30日、昨日", base.replace(hour=21)) == [first[4], "、", first[0]]
+    assert resolution_cache_info().hits == 2
+    assert analyze("昨日", base + datetime.timedelta(days=1))[0]["day"] == 17
+    assert resolution_cache_info().misses == 4
+    clear_resolution_cache()
+    assert resolution_cache_info().currsize == 0
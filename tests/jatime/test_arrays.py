@@ -0,0 +1,27 @@
+import array
+
+import pytest
+
+from jatime.arrays import new_column, numpy_module, to_vector
+
+
+def test_new_column():
+    column = new_column()
+    column.append(2**40)
+    assert type(column) == array.array
+    assert list(column) == [2**40]
+
+
+def test_numpy_module_not_used():
+    assert numpy_module(False) is None
+    assert to_vector(new_column(), None) == new_column()
+
+
+def test_numpy_module_required():
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError):
+            numpy_module(True)
+    else:
+        assert numpy_module(True) is numpy
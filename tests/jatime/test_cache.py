@@ -0,0 +1,79 @@
+import datetime
+import threading
+
+import pytest
+
+from jatime.analyzer import analyze
+from jatime.cache import AnalysisCache, CacheInfo
+
+BASE = datetime.datetime(2020, 10, 17, 9, 30)
+
+
+@pytest.mark.parametrize(
+    "string", ["", "あ", "昨日と来月", "それは令和２年十月十七日の出来事でした。"]
+)
+def test_analysis_cache_agrees_with_analyze(string):
+    cache = AnalysisCache()
+    assert cache.analyze(string, BASE) == analyze(string, BASE)
+    assert cache.analyze(string, BASE) == analyze(string, BASE)
+    assert cache.info() == CacheInfo(1, 1, 0, 1024, 1)
+
+
+def test_analysis_cache_normalizes_base_to_date():
+    cache = AnalysisCache()
+    cache.analyze("昨日", BASE)
+    cache.analyze("昨日", BASE.replace(hour=23, microsecond=1))
+    assert cache.info().hits == 1
+    result = cache.analyze("昨日", BASE + datetime.timedelta(days=1))
+    assert result[0]["day"] == 17
+    assert cache.info().misses == 2
+
+
+def test_analysis_cache_evicts_least_recently_used():
+    cache = AnalysisCache(maxsize=2)
+    cache.analyze("昨日", BASE)
+    cache.analyze("明日", BASE)
+    cache.analyze("昨日", BASE)
+    cache.analyze("今日", BASE)
+    assert cache.info() == CacheInfo(1, 3, 1, 2, 2)
+    cache.analyze("昨日", BASE)
+    assert cache.info().hits == 2
+    cache.analyze("明日", BASE)
+    assert cache.info().misses == 4
+
+
+def test_analysis_cache_returns_copies():
+    cache = AnalysisCache()
+    cache.analyze("昨日", BASE)[0]["day"] = 0
+    assert cache.analyze("昨日", BASE)[0]["day"] == 16
+
+
+def test_analysis_cache_clear():
+    cache = AnalysisCache()
+    cache.analyze("昨日", BASE)
+    cache.clear()
+    assert cache.info() == CacheInfo(0, 0, 0, 1024, 0)
+
+
+def test_analysis_cache_is_thread_safe():
+    cache = AnalysisCache(maxsize=3)
+    strings = ["昨日", "明日", "今日", "十月十七日", "あ"]
+
+    def work():
+        for _ in range(20):
+            for s in strings:
+                assert cache.analyze(s, BASE) == analyze(s, BASE)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    info = cache.info()
+    assert info.hits + info.misses == 4 * 20 * len(strings)
+    assert info.currsize <= 3
+
+
+def test_analysis_cache_rejects_invalid_size():
+    with pytest.raises(ValueError):
+        AnalysisCache(maxsize=0)
@@ -0,0 +1,48 @@
+import array
+import datetime
+
+import pytest
+
+from jatime.analyzer import analyze_records
+from jatime.columns import COLUMNS, MISSING, analyze_columns
+
+STRINGS = [
+    "それは令和２年十月十七日の出来事でした。",
+    "",
+    "あ",
+    "2021年1月1日(月)と午後３時半",
+    "2月30日",
+]
+
+
+def test_analyze_columns_agree_with_analyze_records():
+    base = datetime.datetime(2020, 10, 17)
+    columns = analyze_columns(STRINGS, base, use_numpy=False)
+    assert list(columns) == COLUMNS
+    rows = list(zip(*(columns[name] for name in COLUMNS)))
+    expected = [
+        (i,) + tuple(MISSING if v is None else v for v in te[:-1])
+        for i, string in enumerate(STRINGS)
+        for te in analyze_records(string, base)
+    ]
+    assert rows == expected
+
+
+def test_analyze_columns_returns_arrays():
+    columns = analyze_columns(iter(STRINGS), use_numpy=False)
+    assert all(type(column) == array.array for column in columns.values())
+
+
+def test_analyze_columns_of_nothing():
+    columns = analyze_columns([], use_numpy=False)
+    assert all(len(column) == 0 for column in columns.values())
+
+
+def test_analyze_columns_with_numpy():
+    numpy = pytest.importorskip("numpy")
+    base = datetime.datetime(2020, 10, 17)
+    columns = analyze_columns(STRINGS, base, use_numpy=True)
+    expected = analyze_columns(STRINGS, base, use_numpy=False)
+    for name in COLUMNS:
+        assert type(columns[name]) == numpy.ndarray
+        assert columns[name].tolist() == expected[name].tolist()
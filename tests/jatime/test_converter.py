@@ -1,14 +1,23 @@
+import itertools
+import re
+
 import pytest
 
+from jatime.arrays import MISSING
 from jatime.converter import (
+    _NUMERALS,
     _relative_to_absolute,
     ja_hour_to_24_hour,
+    ja_hours_to_24_hours,
     ja_num_to_int,
+    ja_nums_to_ints,
     jp_year_to_ad_year,
+    jp_years_to_ad_years,
     relative_day_into_absolute,
     relative_month_into_absolute,
     relative_year_into_absolute,
 )
+from jatime.patterns import DAY, MONTH, TIME
 
 
 @pytest.mark.parametrize(
@@ -41,6 +50,20 @@ def test_ja_num_to_int(ja_num, expect):
     assert ja_num_to_int(ja_num) == expect
 
 
+def test_numerals_of_patterns_are_in_the_table():
+    characters = "0123456789０１２３４５６７８９〇零一二三四五六七八九十拾"
+    for n in (1, 2, 3):
+        for num in map("".join, itertools.product(characters, repeat=n)):
+            for pattern, string, group in [
+                (MONTH[0], f"{num}月", "month"),
+                (DAY[0], f"{num}日", "day"),
+                (TIME[1], f"{num}時00分", "hour"),
+                (TIME[1], f"00時{num}分", "minute"),
+            ]:
+                if re.fullmatch(pattern, string):
+                    assert num in _NUMERALS
+
+
 @pytest.mark.parametrize(
     "jp_year, expect",
     [
@@ -58,6 +81,9 @@ def test_ja_num_to_int(ja_num, expect):
         ("平成31", 2019),
         ("令和1", 2019),
         ("令和5", 2023),
+        ("令和元", 2019),
+        ("平成三十一", 2019),
+        ("令和〇〇〇五", 2023),
         ("ああ1", None),
         ("平成あ", None),
         ("平成50", None),
@@ -151,3 +177,34 @@ def test_relative_day_into_absolute(
 )
 def test_ja_hour_to_24_hour(ampm, hour, expect):
     assert ja_hour_to_24_hour(ampm, hour) == expect
+
+
+def _or_missing(value):
+    return MISSING if value is None else value
+
+
+def test_ja_nums_to_ints():
+    nums = ["十二", "１７", "二〇二〇", "", "あ", None, 5, "十二", None]
+    expected = [_or_missing(ja_num_to_int(n)) for n in nums]
+    assert list(ja_nums_to_ints(nums, use_numpy=False)) == expected
+    assert list(ja_nums_to_ints(iter(nums), use_numpy=False)) == expected
+
+
+def test_jp_years_to_ad_years():
+    jp_years = ["令和元", "平成三十一", "昭和65", "令和〇〇〇五", None, "令和元"]
+    expected = [2019, 2019, MISSING, 2023, MISSING, 2019]
+    assert list(jp_years_to_ad_years(jp_years, use_numpy=False)) == expected
+
+
+def test_ja_hours_to_24_hours():
+    ampms = ["午後", "PM", "", None, "午前", None]
+    hours = ["三", "１０", "9", "二十", None, "あ"]
+    expected = [15, 22, 9, 20, MISSING, MISSING]
+    assert list(ja_hours_to_24_hours(ampms, hours, use_numpy=False)) == expected
+
+
+def test_bulk_converters_with_numpy():
+    numpy = pytest.importorskip("numpy")
+    result = ja_nums_to_ints(["十二", None], use_numpy=True)
+    assert type(result) == numpy.ndarray
+    assert result.tolist() == [12, MISSING]
@@ -36,3 +36,33 @@ def test_cli_parse_should_echo_result():
 def test_cli_parse_can_be_output_in_json_format():
     result = cli_analyze(format_json=True).output
     json.loads(result)
+
+
+def test_cli_analyze_lines_outputs_a_result_per_line(tmp_path):
+    path = tmp_path / "lines.txt"
+    path.write_text("令和２年十月十七日\nあ\n昨日\n", encoding="utf-8")
+    result = command("analyze-lines", "--format-json", str(path))
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[0])[0]["year"] == 2020
+    assert json.loads(lines[1]) == ["あ"]
+
+
+def test_cli_analyze_lines_in_parallel(tmp_path):
+    path = tmp_path / "lines.txt"
+    path.write_text("令和２年十月十七日\nあ\n" * 5, encoding="utf-8")
+    serial = command("analyze-lines", "--format-json", str(path))
+    parallel = command(
+        "analyze-lines",
+        "--format-json",
+        "--workers",
+        "2",
+        "--chunksize",
+        "2",
+        str(path),
+    )
+    assert parallel.exit_code == 0
+    assert [json.loads(line)[0] for line in parallel.output.splitlines()] == [
+        json.loads(line)[0] for line in serial.output.splitlines()
+    ]
@@ -2,6 +2,8 @@ import pytest
 
 from jatime.errors import NotFoundError
 from jatime.finder import (
+    _search_year,
+    _search_year_month,
     _years_close_to,
     _years_months_close_to,
     year_from_month_day_dow,
@@ -37,6 +39,21 @@ def test_find_year_raises_not_found_error():
         year_from_month_day_dow(2, 30, 0)
 
 
+@pytest.mark.parametrize("base_year", [1, 30, 1900, 2000, 2020, 2099, 2100, 9970, 9999])
+def test_find_year_agrees_with_search(base_year):
+    for month in range(0, 14):
+        for day in range(0, 33):
+            for dow in range(-1, 8):
+                expected = _search_year(month, day, dow, base_year)
+                if expected is None:
+                    with pytest.raises(NotFoundError):
+                        year_from_month_day_dow(month, day, dow, base_year)
+                else:
+                    assert (
+                        year_from_month_day_dow(month, day, dow, base_year) == expected
+                    )
+
+
 def test__years_months_close_to():
     years = [year for year in _years_months_close_to(2020, 10, 5)]
     expected = [
@@ -73,3 +90,20 @@ def test_find_year_month_base_can_be_none():
 def test_find_year_month_raises_not_found_error():
     with pytest.raises(NotFoundError):
         year_month_from_day_dow(0, 0)
+
+
+@pytest.mark.parametrize(
+    "base_year, base_month",
+    [(1, 1), (1, 5), (2000, 2), (2020, 12), (2100, 1), (9999, 8), (9999, 12)],
+)
+def test_find_year_month_agrees_with_search(base_year, base_month):
+    for day in range(0, 33):
+        for dow in range(-1, 8):
+            expected = _search_year_month(day, dow, base_year, base_month)
+            if expected is None:
+                with pytest.raises(NotFoundError):
+                    year_month_from_day_dow(day, dow, base_year, base_month)
+            else:
+                assert year_month_from_day_dow(day, dow, base_year, base_month) == (
+                    expected
+                )
@@ -1,10 +1,26 @@
 import itertools
 import re
+import threading
 from typing import List
 
 import pytest
 
-from jatime.patterns import datetime_patterns
+import jatime.patterns
+from jatime.patterns import (
+    _GLUE,
+    _ORDERED_PATTERNS,
+    COMPONENTS,
+    DAY,
+    compiled_patterns,
+    component_lookaheads,
+    datetime_patterns,
+    pattern_components,
+    pattern_count,
+    pattern_memory_size,
+    pattern_requirements,
+    possible_patterns,
+    warmup,
+)
 
 
 def extract_time_string(strings: List[str]) -> List[str]:
@@ -438,3 +454,92 @@ def test_time(time):
 )
 def test_combined(string):
     assert extract_time_string([string]) == [string]
+
+
+def test_compiled_patterns_are_built_once():
+    warmup()
+    assert compiled_patterns() is compiled_patterns()
+    assert list(datetime_patterns()) == list(compiled_patterns())
+
+
+def test_compiled_patterns_keep_priority_order():
+    patterns = compiled_patterns()
+    expected_count = 0
+    for time_repr in _ORDERED_PATTERNS:
+        count = 1
+        for component in time_repr:
+            count *= len(component)
+        expected_count += count
+    assert pattern_count() == len(patterns) == expected_count
+    string = "令和２年（２０２０年）１０月１７日（土）１３:１５"
+    assert patterns[0].match(string).group() == string
+
+
+def test_compiled_patterns_are_thread_safe(monkeypatch):
+    # Start from an empty registry so that the threads race to build it.
+    monkeypatch.setattr(jatime.patterns, "_registry", None)
+    builds = []
+    build_registry = jatime.patterns._build_registry
+
+    def counting_build_registry():
+        builds.append(None)
+        return build_registry()
+
+    monkeypatch.setattr(jatime.patterns, "_build_registry", counting_build_registry)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def target():
+        barrier.wait()
+        results.append(compiled_patterns())
+
+    threads = [threading.Thread(target=target) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(builds) == 1
+    assert len(results) == 8
+    assert all(r is results[0] for r in results)
+
+
+def test_pattern_memory_size():
+    assert pattern_memory_size() > pattern_count()
+
+
+def test_pattern_components_rebuild_the_patterns():
+    for pattern, components in zip(compiled_patterns(), pattern_components()):
+        assert pattern.pattern == _GLUE.join(COMPONENTS[i] for i in components)
+
+
+def test_component_lookaheads_find_overlapping_starts():
+    relative_day = component_lookaheads()[COMPONENTS.index(DAY[1])]
+    assert [m.start() for m in relative_day.finditer("一昨日")] == [0, 1]
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "令和２年（２０２０年）１０月１７日（土）１３:１５",
+        "２０２０年１０月１７日（土）１３時１５分",
+        "一昨年の先々月",
+        "明後日の午後九時半",
+        "P.M. 10:30",
+        "土曜日",
+    ],
+)
+def test_matches_contain_required_characters(string):
+    for pattern, clauses in zip(compiled_patterns(), pattern_requirements()):
+        for m in pattern.finditer(string):
+            assert all(not clause.isdisjoint(m.group()) for clause in clauses)
+
+
+@pytest.mark.parametrize("string", ["", "ありがとう", "土曜", "１０月１７日", "10:30"])
+def test_possible_patterns(string):
+    characters = set(string)
+    expected = tuple(
+        n
+        for n, clauses in enumerate(pattern_requirements())
+        if all(not clause.isdisjoint(characters) for clause in clauses)
+    )
+    assert possible_patterns(characters) == expected
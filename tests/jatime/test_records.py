@@ -0,0 +1,27 @@
+from jatime.records import TimeExpression
+
+
+def test_time_expression_has_no_dict():
+    te = TimeExpression(0, 5, 2020, 10, 17, 5, None, None)
+    assert not hasattr(te, "__dict__")
+    assert te.error is None
+
+
+def test_time_expression_to_dict():
+    te = TimeExpression(1, 7, 2020, 10, 17, 5, None, None)
+    assert te.to_dict() == {
+        "start": 1,
+        "end": 7,
+        "year": 2020,
+        "month": 10,
+        "day": 17,
+        "dow": 5,
+        "hour": None,
+        "minute": None,
+    }
+    assert te.to_dict("あ10月17日")["string"] == "10月17日"
+
+
+def test_time_expression_to_dict_with_error():
+    te = TimeExpression(0, 3, None, None, None, None, None, None, "error")
+    assert te.to_dict("2月30日") == {"string": "2月3", "error": "error"}
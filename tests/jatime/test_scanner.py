@@ -0,0 +1,122 @@
+import random
+import re
+
+import pytest
+
+from jatime.analyzer import split
+from jatime.patterns import compiled_patterns
+from jatime.scanner import finditer, scan
+
+
+def normalize(pieces):
+    return [p if type(p) == str else (p.group(), p.groupdict()) for p in pieces]
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "",
+        "あ",
+        "の",
+        "土曜",
+        "土曜です",
+        "日本の",
+        "昨日は十月十七日でした。",
+        "あああ令和２年十月十七日あああ平成一九年(2007年)１０月１８日あああ",
+        "土曜日の１３時１５分に、日曜日の午後３時半",
+        "１３月３２日",
+        "令和元 （ 2019 ） 年の来月 10:30",
+        "２０２０年１０月１７日（土）１３時１５分２０２０年１０月１７日",
+    ],
+)
+def test_scan_is_equivalent_to_split(string):
+    expected = normalize(split(string, compiled_patterns()))
+    assert normalize(scan(string)) == expected
+    assert normalize(scan(string, compiled_patterns())) == expected
+
+
+def test_scan_is_equivalent_to_split_on_random_strings():
+    fragments = (
+        "令和|２|年|十|月|十七|日|（|土|）|曜|曜日|１３|時|１５|分|半|の| |あ|です|"
+        "昨日|来月|今年|午後|PM|:|2020|平成|三|〇|元|(|)"
+    ).split("|")
+    rng = random.Random(0)
+    for _ in range(300):
+        string = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 12)))
+        assert normalize(scan(string)) == normalize(
+            split(string, compiled_patterns())
+        ), string
+
+
+@pytest.mark.parametrize(
+    "string, patterns",
+    [
+        ("xあy", [re.compile("あ")]),
+        ("abcabc", [re.compile("b"), re.compile("a|c")]),
+        ("1日と2日", [re.compile("と"), re.compile(r"\d")]),
+    ],
+)
+def test_scan_is_equivalent_to_split_with_other_patterns(string, patterns):
+    expected = normalize(split(string, patterns))
+    assert normalize(scan(string, patterns)) == expected
+    assert [m.group() for m in finditer(string, patterns)] == [
+        p[0] for p in expected if type(p) != str
+    ]
+
+
+def test_scan_selects_among_overlapping_candidates():
+    # Candidates of lower priority overlap or cross the matches of higher priority.
+    fragments = "２０２０|年|１|０|月|１７|日|（|土|）|１３|時|１５|分|:|の|あ".split(
+        "|"
+    )
+    rng = random.Random(1)
+    for _ in range(100):
+        string = "".join(rng.choice(fragments) for _ in range(rng.randint(10, 40)))
+        assert normalize(scan(string)) == normalize(
+            split(string, compiled_patterns())
+        ), string
+
+
+def test_scan_selects_within_each_run():
+    # The runs are separated by characters that no time expression contains, and
+    # some of them are too short or left without matches.
+    fragments = "令和２年十月十七日|１３時１５分|昨日|日|あ|1|２０２０年（土）".split(
+        "|"
+    )
+    rng = random.Random(2)
+    for _ in range(50):
+        string = "、".join(rng.choice(fragments) for _ in range(rng.randint(1, 60)))
+        assert normalize(scan(string)) == normalize(
+            split(string, compiled_patterns())
+        ), string
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "十月  十七日　 の  　13時",
+        "令和２年 \n 十月" + " " * 40 + "十七日（ 土 ）",
+        "1日" + "　" * 30,
+    ],
+)
+def test_scan_chains_components_across_whitespace(string):
+    assert normalize(scan(string)) == normalize(split(string, compiled_patterns()))
+
+
+def test_scan_matches_on_the_original_string():
+    string = "それは令和２年十月十七日の出来事でした。"
+    m = scan(string)[1]
+    assert m.string is string
+    assert string[m.start() : m.end()] == "令和２年十月十七日"
+
+
+def test_scan_finds_overlapping_components():
+    # "日曜" could start a DOW at "日", but "1日" has priority as a DAY.
+    assert normalize(scan("1日曜日")) == normalize(
+        split("1日曜日", compiled_patterns())
+    )
+
+
+@pytest.mark.parametrize("string", ["ありがとう", "日本の未来", "12345"])
+def test_scan_returns_strings_without_anchors_as_is(string):
+    assert scan(string) == [string]
@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from jatime.analyzer import contains_time_expression
+from jatime.patterns import COMPONENTS, DOW, possible_components
+from jatime.scanner import finditer, scan
+from jatime.stats import (
+    component_stats,
+    disable_adaptive_order,
+    disable_stats,
+    enable_adaptive_order,
+    enable_stats,
+    ordered_components,
+    pattern_stats,
+    report,
+)
+
+STRINGS = [
+    "それは令和２年十月十七日の出来事でした。",
+    "土曜日の１３時１５分に、日曜日の午後３時半",
+    "ありがとうございました。",
+    "土曜",
+    "十月",
+    "月曜と火曜と水曜",
+    "",
+]
+
+
+@pytest.fixture(autouse=True)
+def stats_off():
+    disable_stats()
+    yield
+    disable_stats()
+
+
+def test_stats_are_off_by_default():
+    scan(STRINGS[0])
+    contains_time_expression(STRINGS[0])
+    assert pattern_stats() == []
+    assert component_stats() == []
+
+
+def test_pattern_stats():
+    enable_stats()
+    for string in STRINGS:
+        scan(string)
+    stats = pattern_stats()
+    assert sum(s.hits for s in stats) == sum(len(list(finditer(s))) for s in STRINGS)
+    assert all(s.hits <= s.attempts and 0 <= s.seconds for s in stats)
+    assert [s.hits for s in stats] == sorted((s.hits for s in stats), reverse=True)
+
+
+def test_report_can_be_dumped_as_json():
+    enable_stats()
+    for string in STRINGS:
+        scan(string)
+        contains_time_expression(string)
+    dumped = json.loads(json.dumps(report(), ensure_ascii=False))
+    assert dumped["patterns"] and dumped["components"]
+    assert dumped["components"][0]["regex"] in COMPONENTS
+
+
+def test_adaptive_order_does_not_change_results():
+    expected = [(contains_time_expression(s), scan(s)) for s in STRINGS]
+    enable_adaptive_order()
+    for _ in range(100):
+        for string, (contains, pieces) in zip(STRINGS, expected):
+            assert contains_time_expression(string) == contains
+            assert [p if type(p) == str else p.span() for p in scan(string)] == [
+                p if type(p) == str else p.span() for p in pieces
+            ]
+
+
+def test_adaptive_order_tries_frequent_hits_first():
+    enable_adaptive_order()
+    dow = COMPONENTS.index(DOW[1])
+    components = possible_components("月曜の10月")
+    assert dow in components
+    for _ in range(300):
+        contains_time_expression("月曜")
+    assert next(iter(ordered_components(components))) == dow
+    disable_adaptive_order()
+    assert set(ordered_components(components)) == components
@@ -0,0 +1,117 @@
+import datetime
+import io
+import random
+import tracemalloc
+
+import pytest
+
+from jatime.analyzer import analyze
+from jatime.patterns import MAX_WIDTH
+from jatime.stream import analyze_file, analyze_stream
+
+_BASE = datetime.datetime(2020, 10, 17)
+
+
+def merge(pieces):
+    merged = []
+    for p in pieces:
+        if p == "":
+            continue
+        if type(p) == str and merged and type(merged[-1]) == str:
+            merged[-1] += p
+        else:
+            merged.append(p)
+    return merged
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 17, 65536])
+def test_analyze_stream_is_the_same_as_analyze(chunk_size):
+    fragments = (
+        "令和|２|年|十|月|十七|日|（|土|）|曜|曜日|１３|時|１５|分|半|の| |あ|です|"
+        "昨日|来月|今年|午後|PM|:|2020|平成|三|元|(|)|、|\n"
+    ).split("|")
+    rng = random.Random(0)
+    for _ in range(30):
+        string = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 60)))
+        result = analyze_stream(io.StringIO(string), _BASE, chunk_size=chunk_size)
+        assert merge(result) == merge(analyze(string, _BASE)), string
+
+
+def test_analyze_stream_accepts_chunks():
+    chunks = ["それは令和２年十", "月十七日の出来事でした。"]
+    assert merge(analyze_stream(chunks, _BASE)) == analyze("".join(chunks), _BASE)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_analyze_stream_limits_the_pending_text(chunk_size):
+    string = "1" * 1000 + "令和２年十月十七日" + "1" * 1000
+    chunks = [string[i : i + chunk_size] for i in range(0, len(string), chunk_size)]
+    result = merge(analyze_stream(chunks, _BASE, max_pending=MAX_WIDTH + 1))
+    assert "".join(p if type(p) == str else p["string"] for p in result) == string
+    assert [p for p in result if type(p) == dict] == [
+        p for p in analyze(string, _BASE) if type(p) == dict
+    ]
+    assert [p["string"] for p in result if type(p) == dict] == ["令和２年十月十七日"]
+
+
+def test_analyze_stream_runs_in_bounded_memory():
+    line = "それは令和２年十月十七日の出来事でした。午後３時半に集合。\n"
+
+    def chunks():
+        for _ in range(1000):
+            yield line
+
+    tracemalloc.start()
+    count = 0
+    for p in analyze_stream(chunks(), _BASE):
+        if type(p) == dict:
+            count += 1
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert count == 2000
+    assert peak < len(line) * 1000
+
+
+@pytest.mark.parametrize("kwargs", [{"chunk_size": 0}, {"max_pending": MAX_WIDTH}])
+def test_analyze_stream_rejects_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        analyze_stream([], **kwargs)
+
+
+def expected_records(string):
+    records = []
+    offset = 0
+    for p in analyze(string, _BASE):
+        if type(p) == str:
+            offset += len(p.encode("utf-8"))
+            continue
+        end = offset + len(p["string"].encode("utf-8"))
+        record = {"start": offset, "end": end}
+        record.update({k: v for k, v in p.items() if k != "string"})
+        records.append(record)
+        offset = end
+    return records
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+@pytest.mark.parametrize("chunk_size", [1, 5, 1048576])
+def test_analyze_file_returns_byte_offsets(tmp_path, mmap, chunk_size):
+    string = (
+        "それは令和２年十月十七日の出来事でした。\n明日の午後３時半、2020年1月1日(月)\n"
+        * 3
+    )
+    path = tmp_path / "text.txt"
+    path.write_bytes(string.encode("utf-8"))
+    records = list(analyze_file(str(path), _BASE, mmap=mmap, chunk_size=chunk_size))
+    assert records == expected_records(string)
+    data = path.read_bytes()
+    assert (
+        data[records[0]["start"] : records[0]["end"]].decode() == "令和２年十月十七日"
+    )
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_analyze_file_accepts_an_empty_file(tmp_path, mmap):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert list(analyze_file(str(path), _BASE, mmap=mmap)) == []
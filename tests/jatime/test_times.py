@@ -1,9 +1,11 @@
 import datetime
 import json
+import re
 
 import pytest
 
-from jatime.errors import InvalidValueError
+from jatime.errors import InvalidValueError, NotFoundError
+from jatime.scanner import finditer
 from jatime.times import DateTime
 
 
@@ -188,3 +190,74 @@ class TestDateTime:
     def test_dict_can_be_parsed_into_json_format(self):
         dt = DateTime(ad_year="2021", month="1", day="1")
         json.dumps(dt.to_dict(), indent=2, ensure_ascii=False)
+
+    def test_tuple_has_the_same_values_as_dict(self):
+        dt = DateTime(ad_year="2021", month="1", day="1", hour="9")
+        assert dt.to_tuple() == tuple(dt.to_dict().values())
+
+
+def test_date_time_has_no_dict():
+    assert not hasattr(DateTime(), "__dict__")
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "令和２年十月十七日(土)午後３時半",
+        "平成一九年(2007年)１０月１８日",
+        "明日の9:30",
+        "来月1日",
+        "2021年1月1日(月)",
+        "2月30日",
+        "１２月２５日(金)",
+        "13日(金)",
+        "午後17時",
+    ],
+)
+def test_from_match_agrees_with_kwargs(string):
+    base = datetime.datetime(2021, 1, 1)
+    for m in finditer(string):
+        try:
+            expected = DateTime(base=base, **m.groupdict()).to_dict()
+        except InvalidValueError as e:
+            with pytest.raises(InvalidValueError, match=re.escape(str(e))):
+                DateTime.from_match(m, base)
+        else:
+            assert DateTime.from_match(m, base).to_dict() == expected
+
+
+def test_from_groups_ignores_none():
+    dt = DateTime.from_groups({"month": "1", "day": "1", "dow": None, "jp_year": None})
+    assert (dt.month, dt.day, dt.dow) == (1, 1, None)
+
+
+def test_estimation_is_lazy(monkeypatch):
+    import jatime.times
+
+    calls = []
+
+    def year_from_month_day_dow(*args):
+        calls.append(args)
+        return 2020
+
+    monkeypatch.setattr(
+        jatime.times, "year_from_month_day_dow", year_from_month_day_dow
+    )
+    dt = DateTime(base=datetime.datetime(2021, 1, 1), month="4", day="27", dow="月")
+    assert (dt.day, dt.dow) == (27, 0)
+    assert calls == []
+    assert dt.year == 2020
+    assert dt.to_dict()["year"] == 2020
+    assert calls == [(4, 27, 0, 2021)]
+
+
+def test_estimation_error_is_raised_on_access():
+    dt = DateTime(month="2", day="30", dow="月")
+    with pytest.raises(NotFoundError):
+        dt.year
+
+
+def test_assigned_fields_are_not_estimated():
+    dt = DateTime(base=datetime.datetime(2021, 1, 1), day="13", dow="金")
+    dt.month = 3
+    assert (dt.year, dt.month) == (2020, 3)